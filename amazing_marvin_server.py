@@ -6,27 +6,120 @@ This MCP server provides tools to interact with Amazing Marvin's task management
 Built with FastMCP following MCP best practices for agent-centric design.
 """
 
+import asyncio
+import functools
+import itertools
 import os
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import random
+import re
+import time
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from typing import Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable, Set, Tuple
 from enum import Enum
 import json
 import httpx
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from mcp.server.fastmcp import FastMCP
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared HTTP client when the server shuts down."""
+    try:
+        yield
+    finally:
+        await _close_client()
+
+
 # Initialize the MCP server
-mcp = FastMCP("amazing_marvin_mcp")
+mcp = FastMCP("amazing_marvin_mcp", lifespan=_lifespan)
 
 # Constants
 API_BASE_URL = "https://serv.amazingmarvin.com/api"
 CHARACTER_LIMIT = 25000  # Maximum response size in characters
+TRUNCATE_SEARCH_WINDOW = 500  # How far back from the limit to look for a line break
 DEFAULT_LIMIT = 20
 MAX_LIMIT = 100
+MS_PER_DAY = 86_400_000
+
+# JSON responses are compact (fewer bytes and tokens for the LLM); set
+# MARVIN_PRETTY_JSON=1 to indent them while debugging
+PRETTY_JSON = os.getenv("MARVIN_PRETTY_JSON", "").lower() in ("1", "true", "yes")
+
+# Pre-formatted labels for the most common time estimates (milliseconds)
+_TIME_ESTIMATE_LABELS = {
+    900000: "15m",
+    1800000: "30m",
+    2700000: "45m",
+    3600000: "1h",
+    5400000: "1h 30m",
+    7200000: "2h",
+    10800000: "3h",
+}
+
+# Markdown templates for task lists, bound once as str.format callables.
+# Header templates end with one newline; the join adds the blank line after.
+_TODAY_HEADER = "# Today's Tasks ({date})\n\nFound {count} task{plural}\n".format
+_DUE_HEADER = "# Due & Overdue Tasks (as of {date})\n\nFound {count} task{plural} requiring attention\n".format
+_TODAY_TASK = "## {status} {title}\n- **ID**: {task_id}\n{due}{estimate}{project}{note}".format
+_DUE_TASK = "## {status} {title}{tag}\n- **ID**: {task_id}\n- **Due**: {due}\n{estimate}{note}".format
+
+# Date format accepted by date inputs (YYYY-MM-DD)
+DATE_PATTERN = r'^\d{4}-\d{2}-\d{2}$'
+_DATE_RE = re.compile(DATE_PATTERN, re.ASCII)
+
+# HTTP client configuration (shared connection pool with keep-alive)
+HTTP_TIMEOUT = httpx.Timeout(connect=5.0, read=10.0, write=10.0, pool=5.0)  # Per attempt
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+
+# Retry policy for transient failures (capped exponential backoff with jitter)
+MAX_ATTEMPTS = 4
+RETRY_BASE_DELAY = 0.5  # Seconds before the first retry
+RETRY_MAX_DELAY = 8.0  # Upper bound for any single backoff
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Read cache policy: endpoint -> (fresh seconds, extra stale-while-revalidate seconds)
+CACHE_TTLS: Dict[str, Tuple[float, float]] = {
+    "/todayItems": (30.0, 120.0),
+    "/dueItems": (30.0, 120.0),
+    "/children": (30.0, 120.0),
+    "/categories": (300.0, 1800.0),
+    "/labels": (300.0, 1800.0),
+}
+CACHE_MAX_ENTRIES = 1024  # Entries past their SWR window are swept, then the oldest evicted, past this size
+
+# Write endpoint -> cached read endpoints it makes outdated
+_TASK_LIST_ENDPOINTS = frozenset({"/todayItems", "/dueItems", "/children"})
+CACHE_INVALIDATIONS: Dict[str, frozenset] = {
+    "/addTask": _TASK_LIST_ENDPOINTS,
+    "/markDone": _TASK_LIST_ENDPOINTS,
+    "/editTask": _TASK_LIST_ENDPOINTS,
+}
 
 # Environment Configuration
 API_TOKEN = os.getenv("AMAZING_MARVIN_API_TOKEN", "")
 
+# Authentication headers, built once at import
+_HEADERS_API = {"X-API-Token": API_TOKEN}
+_HEADERS_FULL = {"X-Full-Access-Token": os.getenv("AMAZING_MARVIN_FULL_TOKEN", "")}
+
+# Shared HTTP client, created lazily on first request
+_client: Optional[httpx.AsyncClient] = None
+
+# Read cache: (endpoint, params JSON) -> (generated_at, stale_at, payload)
+_cache: Dict[Tuple[str, str], Tuple[float, float, Any]] = {}
+_refreshing: Set[Tuple[str, str]] = set()
+_inflight: Dict[Tuple[str, str], "asyncio.Future[Any]"] = {}
+_background_tasks: Set["asyncio.Task[None]"] = set()
+# Bumped by every invalidation, so fetches started before a write don't store
+_cache_generations: Dict[str, int] = {}
+
 
 # ============================================================================
 # Enums and Shared Models
@@ -47,15 +140,314 @@ class BaseTaskInput(BaseModel):
     )
 
 
+class DateFieldsInput(BaseTaskInput):
+    """Base model validating YYYY-MM-DD date fields with one shared compiled regex."""
+
+    @field_validator('date', 'day', 'due_date', check_fields=False)
+    @classmethod
+    def validate_date_format(cls, v: Optional[str]) -> Optional[str]:
+        """Reject dates that are not in YYYY-MM-DD format."""
+        if v is not None and not _DATE_RE.fullmatch(v):
+            raise ValueError("Date must be in YYYY-MM-DD format (e.g., '2024-03-15')")
+        return v
+
+
 # ============================================================================
 # Shared Utility Functions
 # ============================================================================
 
 def _get_headers(full_access: bool = False) -> Dict[str, str]:
-    """Get appropriate headers for API requests."""
-    if full_access:
-        return {"X-Full-Access-Token": os.getenv("AMAZING_MARVIN_FULL_TOKEN", "")}
-    return {"X-API-Token": API_TOKEN}
+    """Get appropriate headers for API requests (shared dicts; do not mutate)."""
+    return _HEADERS_FULL if full_access else _HEADERS_API
+
+
+def _get_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    Reusing one client keeps TCP/TLS connections to the Amazing Marvin API
+    warm across tool calls instead of reconnecting for every request.
+
+    Returns:
+        Shared httpx.AsyncClient bound to API_BASE_URL
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            timeout=HTTP_TIMEOUT,
+            limits=HTTP_LIMITS,
+            http2=True
+        )
+    return _client
+
+
+async def _close_client() -> None:
+    """Close the shared HTTP client and release pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _to_json(obj: Any, pretty: bool = PRETTY_JSON) -> str:
+    """
+    Serialize a response payload as JSON.
+
+    Uses orjson when installed and the stdlib encoder otherwise; both keep
+    non-ASCII characters as-is so output matches across environments.
+
+    Args:
+        obj: JSON-serializable response payload
+        pretty: Indent with two spaces; otherwise emit compact JSON (default from MARVIN_PRETTY_JSON)
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _to_json_within_limit(response: Dict[str, Any], *keys: str, max_chars: int = CHARACTER_LIMIT) -> str:
+    """
+    Serialize a response, dropping trailing list items only if it exceeds max_chars.
+
+    Compact JSON has no line breaks for _truncate_response to cut at, so
+    oversized responses are shortened structurally instead: the largest
+    item count that fits is found by bisection and "truncated": true is
+    added, keeping the output valid JSON.
+
+    Args:
+        response: Response payload; every key in keys must hold a list
+        *keys: Keys of the lists that may be shortened
+        max_chars: Size budget for the encoded response
+
+    Returns:
+        JSON string of at most max_chars characters (unless even empty lists exceed it)
+    """
+    result = _to_json(response)
+    if len(result) <= max_chars:
+        return result
+
+    full = {key: response[key] for key in keys}
+    response["truncated"] = True
+
+    def encode(count: int) -> str:
+        for key in keys:
+            response[key] = full[key][:count]
+        return _to_json(response)
+
+    # Largest count in [lo, hi] whose encoding fits; count 0 always "fits"
+    lo, hi = 0, max(len(items) for items in full.values()) - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if len(encode(mid)) <= max_chars:
+            lo = mid
+        else:
+            hi = mid - 1
+    return encode(lo)
+
+
+def _is_retry_safe(method: str, e: Exception) -> bool:
+    """Whether a failed request may be re-sent without risking a duplicate write."""
+    if method == "GET":
+        return True
+    return isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Compute the backoff before the next attempt.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        retry_after: Retry-After header value in seconds, if the server sent one
+
+    Returns:
+        Delay in seconds, capped at RETRY_MAX_DELAY
+    """
+    if retry_after:
+        try:
+            return min(RETRY_MAX_DELAY, max(0.0, float(retry_after)))
+        except ValueError:
+            pass  # HTTP-date form; use the computed backoff instead
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) + random.uniform(0, 0.25)
+
+
+async def _send_request(
+    endpoint: str,
+    method: str = "GET",
+    data: Optional[Dict[str, Any]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    full_access: bool = False
+) -> Any:
+    """
+    Send a request to the Amazing Marvin API, bypassing the cache.
+
+    Transient failures are retried up to MAX_ATTEMPTS times. GETs retry on
+    timeouts, connection errors and 429/502/503/504 responses. POSTs are not
+    idempotent, so they only retry when the request never reached the server
+    (connection errors, connect/pool timeouts) or was rejected with 429.
+
+    Args:
+        endpoint: API endpoint (e.g., "/todayItems")
+        method: HTTP method (GET or POST)
+        data: JSON data for POST requests
+        params: Query parameters for GET requests
+        full_access: Whether to use full access token
+
+    Returns:
+        JSON response from API
+
+    Raises:
+        httpx.HTTPStatusError: For HTTP errors after retries are exhausted
+        httpx.TimeoutException: For timeout errors after retries are exhausted
+    """
+    if method not in ("GET", "POST"):
+        raise ValueError(f"Unsupported HTTP method: {method}")
+
+    # httpx sets Content-Type: application/json for json= bodies
+    headers = _get_headers(full_access)
+    client = _get_client()
+
+    for attempt in range(MAX_ATTEMPTS):
+        retries_left = attempt < MAX_ATTEMPTS - 1
+        try:
+            if method == "GET":
+                response = await client.get(endpoint, headers=headers, params=params)
+            else:
+                response = await client.post(endpoint, json=data, headers=headers)
+        except (httpx.TimeoutException, httpx.ConnectError) as e:
+            if not retries_left or not _is_retry_safe(method, e):
+                raise
+            await asyncio.sleep(_retry_delay(attempt))
+            continue
+
+        status = response.status_code
+        if retries_left and status in RETRY_STATUS_CODES and (method == "GET" or status == 429):
+            await asyncio.sleep(_retry_delay(attempt, response.headers.get("Retry-After")))
+            continue
+
+        response.raise_for_status()
+        # httpx has already read the body; orjson parses the bytes without a str copy
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+
+def _cache_key(endpoint: str, params: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+    """Build the read-cache key for an endpoint and its query parameters."""
+    return (endpoint, json.dumps(params or {}, sort_keys=True))
+
+
+def _store_cached(key: Tuple[str, str], payload: Any, generation: int) -> None:
+    """
+    Store a fresh payload in the read cache using the endpoint's TTL policy.
+
+    The payload is dropped if the endpoint was invalidated since the fetch
+    began (generation is the value of _cache_generations at that point), so
+    a read racing a write can't resurrect pre-write data.
+
+    Every date and parent ID passed to the tools is its own key, so the cache
+    is held to CACHE_MAX_ENTRIES: once full, entries past their
+    stale-while-revalidate window are swept, then the oldest are dropped
+    until a quarter of the capacity is free. Generations are per endpoint
+    rather than per key, so eviction leaves them untouched.
+    """
+    if _cache_generations.get(key[0], 0) != generation:
+        return
+    fresh_ttl, _ = CACHE_TTLS[key[0]]
+    now = time.monotonic()
+    # Re-insert so dict order tracks fetch time, oldest first
+    _cache.pop(key, None)
+    if len(_cache) >= CACHE_MAX_ENTRIES:
+        expired = [
+            k for k, (_, stale_at, _) in _cache.items()
+            if now >= stale_at + CACHE_TTLS[k[0]][1]
+        ]
+        for k in expired:
+            del _cache[k]
+        excess = len(_cache) - CACHE_MAX_ENTRIES * 3 // 4
+        for k in list(itertools.islice(_cache, max(excess, 0))):
+            del _cache[k]
+    _cache[key] = (now, now + fresh_ttl, payload)
+
+
+async def _refresh_cached(
+    key: Tuple[str, str],
+    params: Optional[Dict[str, Any]],
+    full_access: bool
+) -> None:
+    """Re-fetch a stale cache entry in the background."""
+    generation = _cache_generations.get(key[0], 0)
+    try:
+        payload = await _send_request(key[0], params=params, full_access=full_access)
+        _store_cached(key, payload, generation)
+    except Exception:
+        # Keep serving the stale entry; the next blocking fetch surfaces errors
+        pass
+    finally:
+        _refreshing.discard(key)
+
+
+def _invalidate_cache(endpoint: str) -> None:
+    """Drop cached reads made outdated by a successful write to endpoint."""
+    stale_endpoints = CACHE_INVALIDATIONS.get(endpoint)
+    if not stale_endpoints:
+        return
+    for stale in stale_endpoints:
+        _cache_generations[stale] = _cache_generations.get(stale, 0) + 1
+    for key in [k for k in _cache if k[0] in stale_endpoints]:
+        del _cache[key]
+    # Later readers must not join a fetch that started before the write
+    for key in [k for k in _inflight if k[0] in stale_endpoints]:
+        del _inflight[key]
+
+
+async def _fetch_coalesced(
+    key: Tuple[str, str],
+    params: Optional[Dict[str, Any]],
+    full_access: bool
+) -> Any:
+    """
+    Fetch and cache a GET, sharing one request among identical concurrent callers.
+
+    Args:
+        key: Cache key from _cache_key()
+        params: Query parameters for the request
+        full_access: Whether to use full access token
+
+    Returns:
+        JSON response from API
+    """
+    pending = _inflight.get(key)
+    if pending is not None:
+        # Shield so a cancelled duplicate caller doesn't cancel the shared fetch
+        return await asyncio.shield(pending)
+
+    future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    generation = _cache_generations.get(key[0], 0)
+    try:
+        payload = await _send_request(key[0], params=params, full_access=full_access)
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Mark retrieved in case no duplicate caller is waiting
+        raise
+    except BaseException:
+        future.cancel()
+        raise
+    else:
+        _store_cached(key, payload, generation)
+        future.set_result(payload)
+        return payload
+    finally:
+        # Invalidation may already have dropped (or replaced) this entry
+        if _inflight.get(key) is future:
+            del _inflight[key]
 
 
 async def _make_api_request(
@@ -68,6 +460,12 @@ async def _make_api_request(
     """
     Reusable function for all API calls to Amazing Marvin.
 
+    GET requests to endpoints listed in CACHE_TTLS are served from an in-memory
+    stale-while-revalidate cache: fresh entries return immediately, stale entries
+    return immediately while a background task refreshes them, and expired
+    entries are fetched before returning. Identical concurrent fetches share a
+    single request. Writes invalidate affected entries.
+
     Args:
         endpoint: API endpoint (e.g., "/todayItems")
         method: HTTP method (GET or POST)
@@ -82,20 +480,94 @@ async def _make_api_request(
         httpx.HTTPStatusError: For HTTP errors
         httpx.TimeoutException: For timeout errors
     """
-    url = f"{API_BASE_URL}{endpoint}"
-    headers = _get_headers(full_access)
+    if method != "GET" or endpoint not in CACHE_TTLS:
+        result = await _send_request(endpoint, method, data, params, full_access)
+        _invalidate_cache(endpoint)
+        return result
+
+    key = _cache_key(endpoint, params)
+    entry = _cache.get(key)
+    if entry is not None:
+        _, stale_at, payload = entry
+        now = time.monotonic()
+        if now < stale_at:
+            return payload
+        if now < stale_at + CACHE_TTLS[endpoint][1]:
+            if key not in _refreshing:
+                _refreshing.add(key)
+                task = asyncio.create_task(_refresh_cached(key, params, full_access))
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
+            return payload
+
+    return await _fetch_coalesced(key, params, full_access)
+
+
+async def _gather_api(*calls: Tuple[Any, ...]) -> List[Any]:
+    """
+    Run independent API requests concurrently.
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        if method == "GET":
-            response = await client.get(url, headers=headers, params=params)
-        elif method == "POST":
-            headers["Content-Type"] = "application/json"
-            response = await client.post(url, json=data, headers=headers)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
+    Args:
+        calls: Argument tuples for _make_api_request, e.g.
+            ("/todayItems", "GET", None, {"date": "2024-03-15"}) or ("/categories",)
 
-        response.raise_for_status()
-        return response.json()
+    Returns:
+        Results in call order; a failed request yields its exception instead
+        of cancelling the others
+    """
+    return await asyncio.gather(
+        *[_make_api_request(*call) for call in calls],
+        return_exceptions=True
+    )
+
+
+def _project_names(categories: Any) -> Dict[str, str]:
+    """Map category/project IDs to titles, tolerating a failed lookup."""
+    if not isinstance(categories, list):
+        return {}
+    return {c["_id"]: c.get("title", "Untitled") for c in categories if c.get("_id")}
+
+
+def _format_http_status_error(e: httpx.HTTPStatusError) -> str:
+    """Map an HTTP error status to an actionable message."""
+    status = e.response.status_code
+    if status == 401:
+        return ("Error: Invalid API token. Please check your AMAZING_MARVIN_API_TOKEN "
+               "environment variable is set correctly. Get your token at "
+               "https://app.amazingmarvin.com/pre?api=")
+    elif status == 403:
+        return ("Error: Permission denied. This operation requires full access token. "
+               "Set AMAZING_MARVIN_FULL_TOKEN environment variable if needed.")
+    elif status == 404:
+        return ("Error: Resource not found. Please check that the ID is correct and "
+               "the item still exists in Amazing Marvin.")
+    elif status == 429:
+        return ("Error: Rate limit exceeded. Please wait a moment before making more "
+               "requests to the Amazing Marvin API.")
+    elif status >= 500:
+        return ("Error: Amazing Marvin server error. The service may be temporarily "
+               "unavailable. Please try again in a few moments.")
+    return f"Error: API request failed with status {status}. Please try again."
+
+
+def _format_timeout_error(e: httpx.TimeoutException) -> str:
+    """Message for requests that exceeded their timeout."""
+    return ("Error: Request timed out. The Amazing Marvin API is taking too long to "
+           "respond. Please try again.")
+
+
+def _format_connect_error(e: httpx.ConnectError) -> str:
+    """Message for requests that could not reach the API."""
+    return ("Error: Cannot connect to Amazing Marvin API. Please check your internet "
+           "connection and try again.")
+
+
+# Exception type -> message formatter, resolved along the exception's MRO
+_ERROR_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    httpx.HTTPStatusError: _format_http_status_error,
+    httpx.TimeoutException: _format_timeout_error,
+    httpx.ConnectError: _format_connect_error,
+}
 
 
 def _handle_api_error(e: Exception) -> str:
@@ -108,34 +580,34 @@ def _handle_api_error(e: Exception) -> str:
     Returns:
         Human-readable error message with guidance
     """
-    if isinstance(e, httpx.HTTPStatusError):
-        status = e.response.status_code
-        if status == 401:
-            return ("Error: Invalid API token. Please check your AMAZING_MARVIN_API_TOKEN "
-                   "environment variable is set correctly. Get your token at "
-                   "https://app.amazingmarvin.com/pre?api=")
-        elif status == 403:
-            return ("Error: Permission denied. This operation requires full access token. "
-                   "Set AMAZING_MARVIN_FULL_TOKEN environment variable if needed.")
-        elif status == 404:
-            return ("Error: Resource not found. Please check that the ID is correct and "
-                   "the item still exists in Amazing Marvin.")
-        elif status == 429:
-            return ("Error: Rate limit exceeded. Please wait a moment before making more "
-                   "requests to the Amazing Marvin API.")
-        elif status >= 500:
-            return ("Error: Amazing Marvin server error. The service may be temporarily "
-                   "unavailable. Please try again in a few moments.")
-        return f"Error: API request failed with status {status}. Please try again."
-    elif isinstance(e, httpx.TimeoutException):
-        return ("Error: Request timed out. The Amazing Marvin API is taking too long to "
-               "respond. Please try again.")
-    elif isinstance(e, httpx.ConnectError):
-        return ("Error: Cannot connect to Amazing Marvin API. Please check your internet "
-               "connection and try again.")
+    for cls in type(e).__mro__:
+        formatter = _ERROR_FORMATTERS.get(cls)
+        if formatter is not None:
+            return formatter(e)
     return f"Error: Unexpected error occurred - {type(e).__name__}: {str(e)}"
 
 
+def _tool_errors(fn: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """
+    Decorate a tool so any exception is returned as a formatted error string.
+
+    Apply below @mcp.tool so the registered function is the wrapped one.
+
+    Args:
+        fn: Async tool implementation
+
+    Returns:
+        Wrapped tool returning _handle_api_error(e) instead of raising
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
+        try:
+            return await fn(*args, **kwargs)
+        except Exception as e:
+            return _handle_api_error(e)
+    return wrapper
+
+
 def _format_timestamp(timestamp: Optional[int], default: str = "Not set") -> str:
     """
     Convert Unix timestamp (milliseconds) to human-readable format.
@@ -150,12 +622,28 @@ def _format_timestamp(timestamp: Optional[int], default: str = "Not set") -> str
     if not timestamp:
         return default
     try:
-        dt = datetime.fromtimestamp(timestamp / 1000)
-        return dt.strftime("%Y-%m-%d")
+        return _format_timestamp_cached(timestamp)
     except (ValueError, OSError):
         return default
 
 
+@functools.lru_cache(maxsize=1024)
+def _format_timestamp_cached(timestamp: int) -> str:
+    """Format a millisecond timestamp as YYYY-MM-DD, memoized per value."""
+    return datetime.fromtimestamp(timestamp / 1000).strftime("%Y-%m-%d")
+
+
+@functools.lru_cache(maxsize=1024)
+def _wall_clock_ms(timestamp: int) -> int:
+    """
+    Shift a millisecond timestamp by its local UTC offset at that instant.
+
+    Differences between shifted values follow the local wall clock, so day
+    counts floor-divided from them don't slip by one across DST changes.
+    """
+    return timestamp + time.localtime(timestamp // 1000).tm_gmtoff * 1000
+
+
 def _format_time_estimate(ms: Optional[int]) -> str:
     """
     Convert time estimate in milliseconds to human-readable format.
@@ -168,7 +656,14 @@ def _format_time_estimate(ms: Optional[int]) -> str:
     """
     if not ms:
         return "Not set"
+    if ms in _TIME_ESTIMATE_LABELS:
+        return _TIME_ESTIMATE_LABELS[ms]
+    return _format_time_estimate_cached(ms)
+
 
+@functools.lru_cache(maxsize=2048)
+def _format_time_estimate_cached(ms: int) -> str:
+    """Format a non-zero millisecond estimate, memoized per value."""
     hours = ms // 3600000
     minutes = (ms % 3600000) // 60000
 
@@ -196,11 +691,10 @@ def _truncate_response(content: str, items_count: int) -> str:
     if len(content) <= CHARACTER_LIMIT:
         return content
 
-    # Truncate to CHARACTER_LIMIT and add guidance
-    truncated = content[:CHARACTER_LIMIT]
-    last_newline = truncated.rfind('\n')
-    if last_newline > 0:
-        truncated = truncated[:last_newline]
+    # Cut at the last line break shortly before CHARACTER_LIMIT (or at the
+    # limit itself) so only one slice of the content is copied
+    last_newline = content.rfind('\n', CHARACTER_LIMIT - TRUNCATE_SEARCH_WINDOW, CHARACTER_LIMIT)
+    truncated = content[:last_newline if last_newline > 0 else CHARACTER_LIMIT]
 
     truncated += (
         f"\n\n---\n**Response Truncated**: Showing partial results due to size limit "
@@ -212,12 +706,37 @@ def _truncate_response(content: str, items_count: int) -> str:
     return truncated
 
 
+def _truncation_notice(shown: int, total: int) -> str:
+    """
+    Guidance appended when a markdown list stops early at CHARACTER_LIMIT.
+
+    Args:
+        shown: Number of items rendered before the limit was reached
+        total: Total number of items returned by the API
+
+    Returns:
+        Notice naming how many items were left out, with next steps
+    """
+    return (
+        f"\n---\n**Response Truncated**: Showing {shown} of {total} items due to size "
+        f"limit ({total - shown:,} more not shown). To see more:\n"
+        f"- Use pagination with `limit` and `offset` parameters\n"
+        f"- Add filters to narrow down results\n"
+        f"- Request specific items by ID\n"
+    )
+
+
 # ============================================================================
 # Pydantic Input Models
 # ============================================================================
 
-class AddTaskInput(BaseTaskInput):
-    """Input model for creating a new task."""
+class AddTaskInput(DateFieldsInput):
+    """
+    Input model for creating a new task.
+
+    Fields dump to /addTask API names via serialization aliases, so
+    model_dump(by_alias=True) yields the request payload directly.
+    """
     title: str = Field(
         ...,
         description=(
@@ -241,18 +760,20 @@ class AddTaskInput(BaseTaskInput):
             "Schedule date in YYYY-MM-DD format to add task to daily schedule "
             "(e.g., '2024-03-15', '2024-12-25')"
         ),
-        pattern=r'^\d{4}-\d{2}-\d{2}$'
+        json_schema_extra={"pattern": DATE_PATTERN}
     )
     due_date: Optional[str] = Field(
         default=None,
+        serialization_alias="dueDate",
         description=(
             "Due date in YYYY-MM-DD format for deadline tracking "
             "(e.g., '2024-03-20')"
         ),
-        pattern=r'^\d{4}-\d{2}-\d{2}$'
+        json_schema_extra={"pattern": DATE_PATTERN}
     )
     parent_id: Optional[str] = Field(
         default=None,
+        serialization_alias="parentId",
         description=(
             "ID of parent project or category (get from marvin_get_categories). "
             "Example: 'cat_abc123xyz'"
@@ -260,6 +781,7 @@ class AddTaskInput(BaseTaskInput):
     )
     label_ids: Optional[List[str]] = Field(
         default=None,
+        serialization_alias="labelIds",
         description=(
             "List of label IDs to attach to task (get from marvin_get_labels). "
             "Example: ['label_1', 'label_2']"
@@ -268,6 +790,7 @@ class AddTaskInput(BaseTaskInput):
     )
     time_estimate: Optional[int] = Field(
         default=None,
+        serialization_alias="timeEstimate",
         description=(
             "Estimated time in milliseconds. "
             "Common values: 900000 (15 min), 1800000 (30 min), 3600000 (1 hour), "
@@ -278,11 +801,12 @@ class AddTaskInput(BaseTaskInput):
     )
     is_starred: Optional[bool] = Field(
         default=None,
+        serialization_alias="isStarred",
         description="Whether to star/prioritize this task (true/false)"
     )
 
 
-class GetTasksInput(BaseTaskInput):
+class GetTasksInput(DateFieldsInput):
     """Input model for retrieving tasks with optional filters."""
     date: Optional[str] = Field(
         default=None,
@@ -290,7 +814,7 @@ class GetTasksInput(BaseTaskInput):
             "Date in YYYY-MM-DD format (defaults to today). "
             "Examples: '2024-03-15', '2024-12-25'"
         ),
-        pattern=r'^\d{4}-\d{2}-\d{2}$'
+        json_schema_extra={"pattern": DATE_PATTERN}
     )
     response_format: ResponseFormat = Field(
         default=ResponseFormat.MARKDOWN,
@@ -363,6 +887,7 @@ class SimpleFormatInput(BaseTaskInput):
         "openWorldHint": True
     }
 )
+@_tool_errors
 async def marvin_add_task(params: AddTaskInput) -> str:
     """
     Create a new task in Amazing Marvin with full support for scheduling, labels, and organization.
@@ -408,51 +933,29 @@ async def marvin_add_task(params: AddTaskInput) -> str:
         - Returns validation error if title empty or dates malformed
         - All errors include guidance on how to proceed
     """
-    try:
-        # Build task data from validated input
-        task_data = {
-            "title": params.title,
-            "done": False
-        }
+    # Build task data from validated input, omitting unset optional fields
+    task_data = params.model_dump(by_alias=True, exclude_none=True)
+    task_data["done"] = False
 
-        # Add optional fields if provided
-        if params.note is not None:
-            task_data["note"] = params.note
-        if params.day is not None:
-            task_data["day"] = params.day
-        if params.due_date is not None:
-            task_data["dueDate"] = params.due_date
-        if params.parent_id is not None:
-            task_data["parentId"] = params.parent_id
-        if params.label_ids is not None:
-            task_data["labelIds"] = params.label_ids
-        if params.time_estimate is not None:
-            task_data["timeEstimate"] = params.time_estimate
-        if params.is_starred is not None:
-            task_data["isStarred"] = params.is_starred
-
-        # Make API request
-        result = await _make_api_request("/addTask", method="POST", data=task_data)
-
-        # Format success response
-        lines = [
-            "✅ Task created successfully!",
-            "",
-            f"**ID**: {result.get('_id', 'N/A')}",
-            f"**Title**: {result.get('title', 'N/A')}"
-        ]
+    # Make API request
+    result = await _make_api_request("/addTask", method="POST", data=task_data)
 
-        if result.get('day'):
-            lines.append(f"**Scheduled**: {_format_timestamp(result.get('day'))}")
-        if result.get('dueDate'):
-            lines.append(f"**Due**: {_format_timestamp(result.get('dueDate'))}")
-        if result.get('timeEstimate'):
-            lines.append(f"**Time Estimate**: {_format_time_estimate(result.get('timeEstimate'))}")
+    # Format success response
+    lines = [
+        "✅ Task created successfully!",
+        "",
+        f"**ID**: {result.get('_id', 'N/A')}",
+        f"**Title**: {result.get('title', 'N/A')}"
+    ]
 
-        return "\n".join(lines)
+    if result.get('day'):
+        lines.append(f"**Scheduled**: {_format_timestamp(result.get('day'))}")
+    if result.get('dueDate'):
+        lines.append(f"**Due**: {_format_timestamp(result.get('dueDate'))}")
+    if result.get('timeEstimate'):
+        lines.append(f"**Time Estimate**: {_format_time_estimate(result.get('timeEstimate'))}")
 
-    except Exception as e:
-        return _handle_api_error(e)
+    return "\n".join(lines)
 
 
 @mcp.tool(
@@ -465,6 +968,7 @@ async def marvin_add_task(params: AddTaskInput) -> str:
         "openWorldHint": True
     }
 )
+@_tool_errors
 async def marvin_get_todays_tasks(params: GetTasksInput) -> str:
     """
     Retrieve all tasks scheduled for today (or a specific date) in Amazing Marvin.
@@ -521,73 +1025,84 @@ async def marvin_get_todays_tasks(params: GetTasksInput) -> str:
         - Returns "Error: Invalid API token" if authentication fails
         - Date defaults to today if not provided or invalid
     """
-    try:
-        # Use provided date or default to today
-        target_date = params.date or datetime.now().strftime("%Y-%m-%d")
-
-        # Make API request
-        tasks = await _make_api_request(
-            "/todayItems",
-            params={"date": target_date}
-        )
-
-        if not tasks:
-            return f"No tasks scheduled for {target_date}."
-
-        # Format response based on requested format
-        if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [
-                f"# Today's Tasks ({target_date})",
-                "",
-                f"Found {len(tasks)} task{'s' if len(tasks) != 1 else ''}",
-                ""
+    # Use provided date or default to today
+    target_date = params.date or date.today().isoformat()
+
+    # Fetch tasks, plus categories for project names in markdown output
+    calls = [("/todayItems", "GET", None, {"date": target_date})]
+    if params.response_format is ResponseFormat.MARKDOWN:
+        calls.append(("/categories",))
+    tasks, *extra = await _gather_api(*calls)
+    if isinstance(tasks, Exception):
+        raise tasks
+
+    if not tasks:
+        return f"No tasks scheduled for {target_date}."
+
+    # Format response based on requested format
+    if params.response_format is ResponseFormat.MARKDOWN:
+        project_names = _project_names(extra[0])
+        lines = [_TODAY_HEADER(date=target_date, count=len(tasks), plural='s' if len(tasks) != 1 else '')]
+        total_len = len(lines[0])
+        shown = len(tasks)
+
+        for index, task in enumerate(tasks):
+            # Look up each field once
+            task_id = task.get("_id", "")
+            title = task.get("title", "Untitled")
+            done = task.get("done")
+            due_date = task.get("dueDate")
+            estimate = task.get("timeEstimate")
+            parent_id = task.get("parentId")
+            note = task.get("note")
+
+            status = "✅" if done else "⬜"
+            due_line = f"- **Due**: {_format_timestamp(due_date)}\n" if due_date else ""
+            estimate_line = f"- **Estimate**: {_format_time_estimate(estimate)}\n" if estimate else ""
+            if not parent_id:
+                project_line = ""
+            elif parent_id in project_names:
+                project_line = f"- **Project**: {project_names[parent_id]} ({parent_id})\n"
+            else:
+                project_line = f"- **Project**: {parent_id}\n"
+            note_line = f"- **Note**: {note[:200]}\n" if note else ""  # Limit note length
+
+            # One block per task; the trailing newline separates tasks
+            block = _TODAY_TASK(
+                status=status, title=title, task_id=task_id, due=due_line,
+                estimate=estimate_line, project=project_line, note=note_line
+            )
+
+            # Stop once the response would exceed CHARACTER_LIMIT
+            total_len += len(block) + 1
+            if total_len > CHARACTER_LIMIT:
+                shown = index
+                break
+            lines.append(block)
+
+        result = "\n".join(lines)
+        if shown < len(tasks):
+            result += _truncation_notice(shown, len(tasks))
+        return result
+
+    else:  # JSON format
+        response = {
+            "date": target_date,
+            "total": len(tasks),
+            "tasks": [
+                {
+                    "id": t.get("_id"),
+                    "title": t.get("title"),
+                    "done": t.get("done", False),
+                    "dueDate": _format_timestamp(t.get("dueDate")) if t.get("dueDate") else None,
+                    "timeEstimate": _format_time_estimate(t.get("timeEstimate")) if t.get("timeEstimate") else None,
+                    "parentId": t.get("parentId"),
+                    "note": t.get("note")
+                }
+                for t in tasks
             ]
-
-            for task in tasks:
-                status = "✅" if task.get("done") else "⬜"
-                title = task.get("title", "Untitled")
-                task_id = task.get("_id", "")
-
-                lines.append(f"## {status} {title}")
-                lines.append(f"- **ID**: {task_id}")
-
-                if task.get("dueDate"):
-                    lines.append(f"- **Due**: {_format_timestamp(task.get('dueDate'))}")
-                if task.get("timeEstimate"):
-                    lines.append(f"- **Estimate**: {_format_time_estimate(task.get('timeEstimate'))}")
-                if task.get("parentId"):
-                    lines.append(f"- **Project**: {task.get('parentId')}")
-                if task.get("note"):
-                    note = task.get("note", "")[:200]  # Limit note length
-                    lines.append(f"- **Note**: {note}")
-
-                lines.append("")
-
-            result = "\n".join(lines)
-            return _truncate_response(result, len(tasks))
-
-        else:  # JSON format
-            response = {
-                "date": target_date,
-                "total": len(tasks),
-                "tasks": [
-                    {
-                        "id": t.get("_id"),
-                        "title": t.get("title"),
-                        "done": t.get("done", False),
-                        "dueDate": _format_timestamp(t.get("dueDate")) if t.get("dueDate") else None,
-                        "timeEstimate": _format_time_estimate(t.get("timeEstimate")) if t.get("timeEstimate") else None,
-                        "parentId": t.get("parentId"),
-                        "note": t.get("note")
-                    }
-                    for t in tasks
-                ]
-            }
-            result = json.dumps(response, indent=2)
-            return _truncate_response(result, len(tasks))
-
-    except Exception as e:
-        return _handle_api_error(e)
+        }
+        return _to_json_within_limit(response, "tasks")
 
 
 @mcp.tool(
@@ -600,6 +1115,7 @@ async def marvin_get_todays_tasks(params: GetTasksInput) -> str:
         "openWorldHint": True
     }
 )
+@_tool_errors
 async def marvin_mark_done(params: MarkDoneInput) -> str:
     """
     Mark a specific task as complete in Amazing Marvin.
@@ -634,21 +1150,17 @@ async def marvin_mark_done(params: MarkDoneInput) -> str:
         - Returns "Error: Invalid API token" if authentication fails (401)
         - Task remains marked as complete even if called multiple times (idempotent)
     """
-    try:
-        # Make API request
-        await _make_api_request(
-            "/markDone",
-            method="POST",
-            data={"itemId": params.item_id}
-        )
-
-        return (
-            f"✅ Task marked as complete!\n\n"
-            f"**Task ID**: {params.item_id}"
-        )
+    # Make API request
+    await _make_api_request(
+        "/markDone",
+        method="POST",
+        data={"itemId": params.item_id}
+    )
 
-    except Exception as e:
-        return _handle_api_error(e)
+    return (
+        f"✅ Task marked as complete!\n\n"
+        f"**Task ID**: {params.item_id}"
+    )
 
 
 @mcp.tool(
@@ -661,6 +1173,7 @@ async def marvin_mark_done(params: MarkDoneInput) -> str:
         "openWorldHint": True
     }
 )
+@_tool_errors
 async def marvin_get_due_tasks(params: GetTasksInput) -> str:
     """
     Get all tasks that are due today or overdue in Amazing Marvin.
@@ -717,92 +1230,96 @@ async def marvin_get_due_tasks(params: GetTasksInput) -> str:
         - Returns "Error: Invalid API token" if authentication fails
         - Date defaults to today if not provided
     """
-    try:
-        # Use provided date or default to today
-        target_date = params.date or datetime.now().strftime("%Y-%m-%d")
-
-        # Make API request
-        tasks = await _make_api_request(
-            "/dueItems",
-            params={"by": target_date}
-        )
-
-        if not tasks:
-            return f"No due or overdue tasks as of {target_date}."
+    # Use provided date or default to today
+    target_date = params.date or date.today().isoformat()
 
-        # Calculate days overdue for each task
-        target_dt = datetime.strptime(target_date, "%Y-%m-%d")
+    # Make API request
+    tasks = await _make_api_request(
+        "/dueItems",
+        params={"by": target_date}
+    )
 
-        # Format response based on requested format
-        if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [
-                f"# Due & Overdue Tasks (as of {target_date})",
-                "",
-                f"Found {len(tasks)} task{'s' if len(tasks) != 1 else ''} requiring attention",
-                ""
-            ]
+    if not tasks:
+        return f"No due or overdue tasks as of {target_date}."
+
+    # Calculate days overdue for each task using integer wall-clock milliseconds
+    # target_date is validated YYYY-MM-DD (or isoformat()), so slice it directly
+    target_dt = datetime(int(target_date[0:4]), int(target_date[5:7]), int(target_date[8:10]))
+    target_ms = _wall_clock_ms(int(target_dt.timestamp() * 1000))
+
+    # Format response based on requested format
+    if params.response_format is ResponseFormat.MARKDOWN:
+        lines = [_DUE_HEADER(date=target_date, count=len(tasks), plural='s' if len(tasks) != 1 else '')]
+        total_len = len(lines[0])
+        shown = len(tasks)
+
+        for index, task in enumerate(tasks):
+            # Look up each field once
+            task_id = task.get("_id", "")
+            title = task.get("title", "Untitled")
+            done = task.get("done")
+            due_date = task.get("dueDate")
+            estimate = task.get("timeEstimate")
+            note = task.get("note")
+
+            status = "✅" if done else "⬜"
+
+            # Calculate if overdue
+            overdue_tag = ""
+            if due_date:
+                days_diff = (target_ms - _wall_clock_ms(int(due_date))) // MS_PER_DAY
+                if days_diff > 0:
+                    overdue_tag = " [OVERDUE]"
+                elif days_diff == 0:
+                    overdue_tag = " [DUE TODAY]"
+
+            estimate_line = f"- **Estimate**: {_format_time_estimate(estimate)}\n" if estimate else ""
+            note_line = f"- **Note**: {note[:200]}\n" if note else ""
+
+            # One block per task; the trailing newline separates tasks
+            block = _DUE_TASK(
+                status=status, title=title, tag=overdue_tag, task_id=task_id,
+                due=_format_timestamp(due_date), estimate=estimate_line, note=note_line
+            )
+
+            # Stop once the response would exceed CHARACTER_LIMIT
+            total_len += len(block) + 1
+            if total_len > CHARACTER_LIMIT:
+                shown = index
+                break
+            lines.append(block)
+
+        result = "\n".join(lines)
+        if shown < len(tasks):
+            result += _truncation_notice(shown, len(tasks))
+        return result
+
+    else:  # JSON format
+        response = {
+            "asOf": target_date,
+            "total": len(tasks),
+            "tasks": []
+        }
 
-            for task in tasks:
-                status = "✅" if task.get("done") else "⬜"
-                title = task.get("title", "Untitled")
-                task_id = task.get("_id", "")
-                due_date_str = _format_timestamp(task.get("dueDate"))
-
-                # Calculate if overdue
-                overdue_tag = ""
-                if task.get("dueDate"):
-                    due_dt = datetime.fromtimestamp(task.get("dueDate") / 1000)
-                    days_diff = (target_dt - due_dt).days
-                    if days_diff > 0:
-                        overdue_tag = " [OVERDUE]"
-                    elif days_diff == 0:
-                        overdue_tag = " [DUE TODAY]"
-
-                lines.append(f"## {status} {title}{overdue_tag}")
-                lines.append(f"- **ID**: {task_id}")
-                lines.append(f"- **Due**: {due_date_str}")
-
-                if task.get("timeEstimate"):
-                    lines.append(f"- **Estimate**: {_format_time_estimate(task.get('timeEstimate'))}")
-                if task.get("note"):
-                    note = task.get("note", "")[:200]
-                    lines.append(f"- **Note**: {note}")
-
-                lines.append("")
-
-            result = "\n".join(lines)
-            return _truncate_response(result, len(tasks))
-
-        else:  # JSON format
-            response = {
-                "asOf": target_date,
-                "total": len(tasks),
-                "tasks": []
+        for task in tasks:
+            due_date = task.get("dueDate")
+            task_data = {
+                "id": task.get("_id"),
+                "title": task.get("title"),
+                "done": task.get("done", False),
+                "dueDate": _format_timestamp(due_date) if due_date else None,
+                "timeEstimate": _format_time_estimate(task.get("timeEstimate")) if task.get("timeEstimate") else None,
             }
 
-            for task in tasks:
-                task_data = {
-                    "id": task.get("_id"),
-                    "title": task.get("title"),
-                    "done": task.get("done", False),
-                    "dueDate": _format_timestamp(task.get("dueDate")) if task.get("dueDate") else None,
-                    "timeEstimate": _format_time_estimate(task.get("timeEstimate")) if task.get("timeEstimate") else None,
-                }
-
-                # Add days overdue if applicable
-                if task.get("dueDate"):
-                    due_dt = datetime.fromtimestamp(task.get("dueDate") / 1000)
-                    days_diff = (target_dt - due_dt).days
-                    if days_diff > 0:
-                        task_data["daysOverdue"] = days_diff
-
-                response["tasks"].append(task_data)
+            # Add days overdue if applicable
+            if due_date:
+                days_diff = (target_ms - _wall_clock_ms(int(due_date))) // MS_PER_DAY
+                if days_diff > 0:
+                    task_data["daysOverdue"] = days_diff
 
-            result = json.dumps(response, indent=2)
-            return _truncate_response(result, len(tasks))
+            response["tasks"].append(task_data)
 
-    except Exception as e:
-        return _handle_api_error(e)
+        return _to_json_within_limit(response, "tasks")
 
 
 # ============================================================================
@@ -819,6 +1336,7 @@ async def marvin_get_due_tasks(params: GetTasksInput) -> str:
         "openWorldHint": True
     }
 )
+@_tool_errors
 async def marvin_get_categories(params: SimpleFormatInput) -> str:
     """
     List all categories and projects in Amazing Marvin to help identify parent IDs.
@@ -870,61 +1388,56 @@ async def marvin_get_categories(params: SimpleFormatInput) -> str:
         - Returns "No categories or projects found" if none exist
         - Returns "Error: Invalid API token" if authentication fails
     """
-    try:
-        # Make API request
-        categories = await _make_api_request("/categories")
-
-        if not categories:
-            return "No categories or projects found."
-
-        # Format response based on requested format
-        if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [
-                "# Categories & Projects",
-                "",
-                f"Found {len(categories)} categor{'ies' if len(categories) != 1 else 'y'} and projects",
-                ""
-            ]
+    # Make API request
+    categories = await _make_api_request("/categories")
 
-            for cat in categories:
-                title = cat.get("title", "Untitled")
-                cat_id = cat.get("_id", "")
-                cat_type = cat.get("type", "unknown")
-
-                lines.append(f"## {title} ({cat_type})")
-                lines.append(f"- **ID**: {cat_id}")
-                lines.append(f"- **Type**: {cat_type}")
-
-                if cat.get("parentId"):
-                    lines.append(f"- **Parent**: {cat.get('parentId')}")
-                if cat.get("note"):
-                    note = cat.get("note", "")[:150]
-                    lines.append(f"- **Note**: {note}")
-
-                lines.append("")
-
-            result = "\n".join(lines)
-            return _truncate_response(result, len(categories))
-
-        else:  # JSON format
-            response = {
-                "total": len(categories),
-                "categories": [
-                    {
-                        "id": c.get("_id"),
-                        "title": c.get("title"),
-                        "type": c.get("type"),
-                        "parentId": c.get("parentId"),
-                        "note": c.get("note")
-                    }
-                    for c in categories
-                ]
-            }
-            result = json.dumps(response, indent=2)
-            return _truncate_response(result, len(categories))
+    if not categories:
+        return "No categories or projects found."
 
-    except Exception as e:
-        return _handle_api_error(e)
+    # Format response based on requested format
+    if params.response_format is ResponseFormat.MARKDOWN:
+        lines = [
+            "# Categories & Projects",
+            "",
+            f"Found {len(categories)} categor{'ies' if len(categories) != 1 else 'y'} and projects",
+            ""
+        ]
+
+        for cat in categories:
+            title = cat.get("title", "Untitled")
+            cat_id = cat.get("_id", "")
+            cat_type = cat.get("type", "unknown")
+
+            lines.append(f"## {title} ({cat_type})")
+            lines.append(f"- **ID**: {cat_id}")
+            lines.append(f"- **Type**: {cat_type}")
+
+            if cat.get("parentId"):
+                lines.append(f"- **Parent**: {cat.get('parentId')}")
+            if cat.get("note"):
+                note = cat.get("note", "")[:150]
+                lines.append(f"- **Note**: {note}")
+
+            lines.append("")
+
+        result = "\n".join(lines)
+        return _truncate_response(result, len(categories))
+
+    else:  # JSON format
+        response = {
+            "total": len(categories),
+            "categories": [
+                {
+                    "id": c.get("_id"),
+                    "title": c.get("title"),
+                    "type": c.get("type"),
+                    "parentId": c.get("parentId"),
+                    "note": c.get("note")
+                }
+                for c in categories
+            ]
+        }
+        return _to_json_within_limit(response, "categories")
 
 
 @mcp.tool(
@@ -937,6 +1450,7 @@ async def marvin_get_categories(params: SimpleFormatInput) -> str:
         "openWorldHint": True
     }
 )
+@_tool_errors
 async def marvin_get_labels(params: SimpleFormatInput) -> str:
     """
     List all labels in Amazing Marvin to help identify label IDs for task creation.
@@ -986,49 +1500,44 @@ async def marvin_get_labels(params: SimpleFormatInput) -> str:
         - Returns "No labels found" if none exist
         - Returns "Error: Invalid API token" if authentication fails
     """
-    try:
-        # Make API request
-        labels = await _make_api_request("/labels")
-
-        if not labels:
-            return "No labels found."
-
-        # Format response based on requested format
-        if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [
-                "# Labels",
-                "",
-                f"Found {len(labels)} label{'s' if len(labels) != 1 else ''}",
-                ""
-            ]
+    # Make API request
+    labels = await _make_api_request("/labels")
 
-            for label in labels:
-                title = label.get("title", "Untitled")
-                label_id = label.get("_id", "")
-
-                lines.append(f"## {title}")
-                lines.append(f"- **ID**: {label_id}")
-                lines.append("")
-
-            result = "\n".join(lines)
-            return _truncate_response(result, len(labels))
-
-        else:  # JSON format
-            response = {
-                "total": len(labels),
-                "labels": [
-                    {
-                        "id": l.get("_id"),
-                        "title": l.get("title")
-                    }
-                    for l in labels
-                ]
-            }
-            result = json.dumps(response, indent=2)
-            return _truncate_response(result, len(labels))
+    if not labels:
+        return "No labels found."
 
-    except Exception as e:
-        return _handle_api_error(e)
+    # Format response based on requested format
+    if params.response_format is ResponseFormat.MARKDOWN:
+        lines = [
+            "# Labels",
+            "",
+            f"Found {len(labels)} label{'s' if len(labels) != 1 else ''}",
+            ""
+        ]
+
+        for label in labels:
+            title = label.get("title", "Untitled")
+            label_id = label.get("_id", "")
+
+            lines.append(f"## {title}")
+            lines.append(f"- **ID**: {label_id}")
+            lines.append("")
+
+        result = "\n".join(lines)
+        return _truncate_response(result, len(labels))
+
+    else:  # JSON format
+        response = {
+            "total": len(labels),
+            "labels": [
+                {
+                    "id": l.get("_id"),
+                    "title": l.get("title")
+                }
+                for l in labels
+            ]
+        }
+        return _to_json_within_limit(response, "labels")
 
 
 @mcp.tool(
@@ -1041,6 +1550,7 @@ async def marvin_get_labels(params: SimpleFormatInput) -> str:
         "openWorldHint": True
     }
 )
+@_tool_errors
 async def marvin_get_children(params: GetChildrenInput) -> str:
     """
     Get all tasks and projects within a specific category or project in Amazing Marvin.
@@ -1098,71 +1608,66 @@ async def marvin_get_children(params: GetChildrenInput) -> str:
         - Returns "Error: Resource not found" if parent_id doesn't exist (404)
         - Returns "Error: Invalid API token" if authentication fails
     """
-    try:
-        # Make API request
-        items = await _make_api_request(
-            "/children",
-            params={"parentId": params.parent_id}
-        )
-
-        if not items:
-            return f"No items found under parent ID: {params.parent_id}"
+    # Make API request
+    items = await _make_api_request(
+        "/children",
+        params={"parentId": params.parent_id}
+    )
 
-        # Format response based on requested format
-        if params.response_format == ResponseFormat.MARKDOWN:
-            lines = [
-                f"# Items in: {params.parent_id}",
-                "",
-                f"Found {len(items)} item{'s' if len(items) != 1 else ''}",
-                ""
-            ]
+    if not items:
+        return f"No items found under parent ID: {params.parent_id}"
 
-            for item in items:
-                status = "✅" if item.get("done") else "⬜"
-                title = item.get("title", "Untitled")
-                item_type = item.get("type", "task")
-                item_id = item.get("_id", "")
-
-                type_emoji = "📁" if item_type == "project" else status
-                lines.append(f"## {type_emoji} {title} ({item_type})")
-                lines.append(f"- **ID**: {item_id}")
-                lines.append(f"- **Type**: {item_type}")
-
-                if item.get("dueDate"):
-                    lines.append(f"- **Due**: {_format_timestamp(item.get('dueDate'))}")
-                if item.get("timeEstimate"):
-                    lines.append(f"- **Estimate**: {_format_time_estimate(item.get('timeEstimate'))}")
-                if item.get("note"):
-                    note = item.get("note", "")[:150]
-                    lines.append(f"- **Note**: {note}")
-
-                lines.append("")
-
-            result = "\n".join(lines)
-            return _truncate_response(result, len(items))
-
-        else:  # JSON format
-            response = {
-                "parent_id": params.parent_id,
-                "total": len(items),
-                "items": [
-                    {
-                        "id": i.get("_id"),
-                        "title": i.get("title"),
-                        "type": i.get("type"),
-                        "done": i.get("done", False),
-                        "dueDate": _format_timestamp(i.get("dueDate")) if i.get("dueDate") else None,
-                        "timeEstimate": _format_time_estimate(i.get("timeEstimate")) if i.get("timeEstimate") else None,
-                        "note": i.get("note")
-                    }
-                    for i in items
-                ]
-            }
-            result = json.dumps(response, indent=2)
-            return _truncate_response(result, len(items))
+    # Format response based on requested format
+    if params.response_format is ResponseFormat.MARKDOWN:
+        lines = [
+            f"# Items in: {params.parent_id}",
+            "",
+            f"Found {len(items)} item{'s' if len(items) != 1 else ''}",
+            ""
+        ]
 
-    except Exception as e:
-        return _handle_api_error(e)
+        for item in items:
+            status = "✅" if item.get("done") else "⬜"
+            title = item.get("title", "Untitled")
+            item_type = item.get("type", "task")
+            item_id = item.get("_id", "")
+
+            type_emoji = "📁" if item_type == "project" else status
+            lines.append(f"## {type_emoji} {title} ({item_type})")
+            lines.append(f"- **ID**: {item_id}")
+            lines.append(f"- **Type**: {item_type}")
+
+            if item.get("dueDate"):
+                lines.append(f"- **Due**: {_format_timestamp(item.get('dueDate'))}")
+            if item.get("timeEstimate"):
+                lines.append(f"- **Estimate**: {_format_time_estimate(item.get('timeEstimate'))}")
+            if item.get("note"):
+                note = item.get("note", "")[:150]
+                lines.append(f"- **Note**: {note}")
+
+            lines.append("")
+
+        result = "\n".join(lines)
+        return _truncate_response(result, len(items))
+
+    else:  # JSON format
+        response = {
+            "parent_id": params.parent_id,
+            "total": len(items),
+            "items": [
+                {
+                    "id": i.get("_id"),
+                    "title": i.get("title"),
+                    "type": i.get("type"),
+                    "done": i.get("done", False),
+                    "dueDate": _format_timestamp(i.get("dueDate")) if i.get("dueDate") else None,
+                    "timeEstimate": _format_time_estimate(i.get("timeEstimate")) if i.get("timeEstimate") else None,
+                    "note": i.get("note")
+                }
+                for i in items
+            ]
+        }
+        return _to_json_within_limit(response, "items")
 
 
 # ============================================================================
@@ -1179,6 +1684,7 @@ async def marvin_get_children(params: GetChildrenInput) -> str:
         "openWorldHint": True
     }
 )
+@_tool_errors
 async def marvin_start_tracking(params: StartTrackingInput) -> str:
     """
     Start time tracking for a specific task in Amazing Marvin.
@@ -1216,22 +1722,18 @@ async def marvin_start_tracking(params: StartTrackingInput) -> str:
         - Returns "Error: Invalid API token" if authentication fails (401)
         - Automatically stops any previously running timer
     """
-    try:
-        # Make API request using the /track endpoint with START action
-        await _make_api_request(
-            "/track",
-            method="POST",
-            data={"itemId": params.item_id, "action": "START"}
-        )
-
-        return (
-            f"⏱️ Timer started for task!\n\n"
-            f"**Task ID**: {params.item_id}\n\n"
-            f"_Note: Any previously running timer has been stopped._"
-        )
+    # Make API request using the /track endpoint with START action
+    await _make_api_request(
+        "/track",
+        method="POST",
+        data={"itemId": params.item_id, "action": "START"}
+    )
 
-    except Exception as e:
-        return _handle_api_error(e)
+    return (
+        f"⏱️ Timer started for task!\n\n"
+        f"**Task ID**: {params.item_id}\n\n"
+        f"_Note: Any previously running timer has been stopped._"
+    )
 
 
 @mcp.tool(
@@ -1244,6 +1746,7 @@ async def marvin_start_tracking(params: StartTrackingInput) -> str:
         "openWorldHint": True
     }
 )
+@_tool_errors
 async def marvin_stop_tracking() -> str:
     """
     Stop the currently running time tracker in Amazing Marvin.
@@ -1273,21 +1776,17 @@ async def marvin_stop_tracking() -> str:
         - Returns "Error: Invalid API token" if authentication fails
         - Operation succeeds even if no timer is running (idempotent)
     """
-    try:
-        # Make API request using the /track endpoint with STOP action
-        await _make_api_request(
-            "/track",
-            method="POST",
-            data={"action": "STOP"}
-        )
-
-        return (
-            "⏱️ Timer stopped successfully!\n\n"
-            "_Time tracking has been saved to the task._"
-        )
+    # Make API request using the /track endpoint with STOP action
+    await _make_api_request(
+        "/track",
+        method="POST",
+        data={"action": "STOP"}
+    )
 
-    except Exception as e:
-        return _handle_api_error(e)
+    return (
+        "⏱️ Timer stopped successfully!\n\n"
+        "_Time tracking has been saved to the task._"
+    )
 
 
 # ============================================================================
@@ -5,8 +5,15 @@ This MCP server provides tools to interact with Amazing Marvin's task management
 Built with FastMCP and deployed on Smithery for hosted, install-free access.
 """
 
+import asyncio
+import functools
+import io
+import itertools
+import os
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Callable, Tuple
 from enum import Enum
 import json
 import httpx
@@ -14,11 +21,83 @@ from pydantic import BaseModel, Field, field_validator, ConfigDict
 from mcp.server.fastmcp import FastMCP, Context
 from smithery.decorators import smithery
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
+
 # Constants
 API_BASE_URL = "https://serv.amazingmarvin.com/api"
 CHARACTER_LIMIT = 25000  # Maximum response size in characters
+MARKDOWN_BUDGET = CHARACTER_LIMIT  # Size at which list markdown stops adding items
+
+TO_THREAD_THRESHOLD = 200  # Item count above which markdown is rendered in a worker thread
+
+# Optional AddTaskInput fields and their /addTask body keys, in request order
+_ADD_TASK_FIELDS = (
+    ("note", "note"),
+    ("day", "day"),
+    ("due_date", "dueDate"),
+    ("parent_id", "parentId"),
+    ("label_ids", "labelIds"),
+    ("time_estimate", "timeEstimate"),
+    ("is_starred", "isStarred"),
+)
+
+# Status markers used in markdown output
+_EMOJI_DONE = "\u2705"  # ✅
+_EMOJI_TODO = "\u2B1C"  # ⬜
+_EMOJI_PROJECT = "\U0001F4C1"  # 📁
+
+# Due-list title tags, keyed by the sign of the day difference (1 overdue, 0 today, -1 upcoming)
+_OVERDUE_TAG = {1: " [OVERDUE]", 0: " [DUE TODAY]", -1: ""}
+
 DEFAULT_LIMIT = 20
 MAX_LIMIT = 100
+MAX_BULK_TASKS = 50  # Maximum tasks per marvin_add_tasks_bulk call
+BULK_CONCURRENCY = 6  # /addTask requests marvin_add_tasks_bulk keeps in flight at once
+MS_PER_DAY = 86_400_000
+
+# JSON responses are compact (fewer bytes and tokens for the LLM); set
+# MARVIN_PRETTY_JSON=1 to indent them while debugging
+PRETTY_JSON = os.getenv("MARVIN_PRETTY_JSON", "").lower() in ("1", "true", "yes")
+
+# HTTP client configuration (shared connection pool with keep-alive)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=30.0)
+
+# Retry policy for idempotent GETs (POSTs such as /track are never retried)
+MAX_GET_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.2  # Seconds; doubles after each failed attempt
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Shared HTTP client for all sessions, created lazily on first request
+_CLIENT: Optional[httpx.AsyncClient] = None
+_CLIENT_LOCK = asyncio.Lock()
+_active_sessions = 0
+
+# Read cache for GET endpoints: (api_token, endpoint, params) -> (fetched_at, payload)
+CACHE_TTL = 60.0  # Seconds, for endpoints not listed in CACHE_TTLS
+CACHE_TTLS = {
+    "/categories": 300.0,
+    "/labels": 300.0,
+    "/children": 60.0,
+    "/todayItems": 30.0,
+    "/dueItems": 30.0,
+}
+NEGATIVE_CACHE_TTL = 15.0  # Seconds; empty results are kept briefly so new items show up soon
+TASK_LIST_ENDPOINTS = ("/todayItems", "/dueItems", "/children")  # Invalidated by task writes
+CACHE_MAX_ENTRIES = 1024  # Expired entries are swept, then the oldest evicted, past this size
+_CacheKey = Tuple[str, str, Tuple[Tuple[str, Any], ...]]
+_RESP_CACHE: Dict[_CacheKey, Tuple[float, Any]] = {}
+_CACHE_LOCKS: Dict[_CacheKey, asyncio.Lock] = {}
+# (api_token, endpoint) -> generation set by the last invalidation; values come
+# from one counter, so a fetch never mistakes a reset entry for its own
+_CACHE_GENERATIONS: Dict[Tuple[str, str], int] = {}
+_GENERATION_COUNTER = itertools.count(1)
+
+# Default date for the today/due tools, refreshed once per minute
+_today_cache: Dict[str, Any] = {"minute": -1, "date": ""}
 
 
 # ============================================================================
@@ -59,19 +138,74 @@ class BaseTaskInput(BaseModel):
 # Shared Utility Functions
 # ============================================================================
 
-def _get_headers(ctx: Context, full_access: bool = False) -> Dict[str, str]:
+def _get_headers(ctx: Context, full_access: bool = False, post: bool = False) -> Dict[str, str]:
     """
     Get appropriate headers for API requests.
 
+    The dict is shared between calls with the same token and must not be mutated.
+
     Args:
         ctx: Smithery context with session config
         full_access: Whether to use full access token (not currently supported)
+        post: Include the JSON Content-Type header for request bodies
 
     Returns:
         Headers dict with API token
     """
     config: AmazingMarvinConfig = ctx.session_config
-    return {"X-API-Token": config.api_token}
+    return _build_headers(config.api_token, post)
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_headers(api_token: str, post: bool) -> Dict[str, str]:
+    """Build the GET or POST headers for one API token, once per token."""
+    if post:
+        return {"X-API-Token": api_token, "Content-Type": "application/json"}
+    return {"X-API-Token": api_token}
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    One client serves every session so TCP/TLS connections (and HTTP/2
+    streams) to the Amazing Marvin API are reused across tool calls.
+    Authentication stays per request via _get_headers().
+
+    Returns:
+        Shared httpx.AsyncClient bound to API_BASE_URL
+    """
+    global _CLIENT
+    if _CLIENT is not None and not _CLIENT.is_closed:
+        return _CLIENT
+    async with _CLIENT_LOCK:
+        if _CLIENT is None or _CLIENT.is_closed:
+            _CLIENT = httpx.AsyncClient(
+                base_url=API_BASE_URL,
+                timeout=HTTP_TIMEOUT,
+                limits=HTTP_LIMITS,
+                http2=True
+            )
+        return _CLIENT
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """
+    Close the shared HTTP client once the last active session ends.
+
+    FastMCP enters the lifespan once per session on HTTP transports, so
+    sessions are counted rather than closing the client on every exit.
+    """
+    global _CLIENT, _active_sessions
+    _active_sessions += 1
+    try:
+        yield
+    finally:
+        _active_sessions -= 1
+        if _active_sessions == 0 and _CLIENT is not None:
+            client, _CLIENT = _CLIENT, None
+            await client.aclose()
 
 
 async def _make_api_request(
@@ -85,6 +219,12 @@ async def _make_api_request(
     """
     Reusable function for all API calls to Amazing Marvin.
 
+    GETs are idempotent, so they are retried up to MAX_GET_ATTEMPTS times in
+    total on transport errors and on RETRY_STATUS_CODES (429, 502, 503, 504),
+    sleeping RETRY_BASE_DELAY and doubling it before each retry; the last
+    attempt's error or response is what the caller sees. POSTs are sent
+    exactly once and never retried, so a write can't be applied twice.
+
     Args:
         endpoint: API endpoint (e.g., "/todayItems")
         ctx: Smithery context with session config
@@ -100,20 +240,150 @@ async def _make_api_request(
         httpx.HTTPStatusError: For HTTP errors
         httpx.TimeoutException: For timeout errors
     """
-    url = f"{API_BASE_URL}{endpoint}"
-    headers = _get_headers(ctx, full_access)
+    client = await _get_client()
+
+    if method == "GET":
+        headers = _get_headers(ctx, full_access)
+        for attempt in range(MAX_GET_ATTEMPTS):
+            retryable = attempt < MAX_GET_ATTEMPTS - 1
+            try:
+                response = await client.get(endpoint, headers=headers, params=params)
+            except httpx.TransportError:
+                if not retryable:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or not retryable:
+                    break
+            await asyncio.sleep(RETRY_BASE_DELAY * (2 ** attempt))
+    elif method == "POST":
+        headers = _get_headers(ctx, full_access, post=True)
+        body = _encode_body(data) if data is not None else None
+        response = await client.post(endpoint, content=body, headers=headers)
+    else:
+        raise ValueError(f"Unsupported HTTP method: {method}")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        if method == "GET":
-            response = await client.get(url, headers=headers, params=params)
-        elif method == "POST":
-            headers["Content-Type"] = "application/json"
-            response = await client.post(url, json=data, headers=headers)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
+    response.raise_for_status()
+    # httpx has already read the body; orjson parses the bytes without a str copy
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+async def _cached_api_get(
+    endpoint: str,
+    ctx: Context,
+    params: Optional[Dict[str, Any]] = None,
+    ttl: Optional[float] = None
+) -> Any:
+    """
+    GET an endpoint through a per-user in-process TTL cache.
+
+    Concurrent misses for the same key wait on one lock so only a single
+    request reaches the API (stampede prevention). Empty results are cached
+    for at most NEGATIVE_CACHE_TTL so repeated probes of an empty list stay
+    local without hiding newly created items for the full TTL.
+
+    Args:
+        endpoint: API endpoint (e.g., "/categories")
+        ctx: Smithery context with session config
+        params: Query parameters, part of the cache key
+        ttl: Seconds a cached response stays valid (defaults to CACHE_TTLS)
+
+    Returns:
+        JSON response from API or cache
+    """
+    if ttl is None:
+        ttl = CACHE_TTLS.get(endpoint, CACHE_TTL)
+    config: AmazingMarvinConfig = ctx.session_config
+    key = (config.api_token, endpoint, tuple(sorted(params.items())) if params else ())
+
+    entry = _RESP_CACHE.get(key)
+    if entry is not None and _is_fresh(entry, ttl):
+        return entry[1]
+
+    lock = _CACHE_LOCKS.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            # Another caller may have filled the cache while we waited
+            entry = _RESP_CACHE.get(key)
+            if entry is not None and _is_fresh(entry, ttl):
+                return entry[1]
+            generation = _CACHE_GENERATIONS.get(key[:2], 0)
+            payload = await _make_api_request(endpoint, ctx, params=params)
+            _store_cached(key, payload, generation)
+            return payload
+    finally:
+        # Drop the lock only once released, so nobody can start a duplicate
+        # fetch under a fresh lock while this one is running; waiters already
+        # hold the object, and later callers hit the cache (or retry on failure)
+        if _CACHE_LOCKS.get(key) is lock:
+            del _CACHE_LOCKS[key]
+
+
+def _store_cached(key: _CacheKey, payload: Any, generation: int) -> None:
+    """
+    Insert a response into _RESP_CACHE, keeping it within CACHE_MAX_ENTRIES.
+
+    The payload is dropped if the caller's endpoint was invalidated since
+    the fetch began (generation is the _CACHE_GENERATIONS value read before
+    the request), so a read racing a write can't store pre-write data.
+
+    Keys include the token and query params, so a long-lived multi-tenant
+    process would otherwise keep every token, date and parent ID it has
+    seen. Once the cache is full, entries past their endpoint's TTL are
+    swept; if that frees too little, the oldest entries are dropped until a
+    quarter of the capacity is free, so sweeps stay rare.
+    """
+    if _CACHE_GENERATIONS.get(key[:2], 0) != generation:
+        return
+    # Re-insert so dict order tracks fetch time, oldest first
+    _RESP_CACHE.pop(key, None)
+    if len(_RESP_CACHE) >= CACHE_MAX_ENTRIES:
+        expired = [
+            k for k, entry in _RESP_CACHE.items()
+            if not _is_fresh(entry, CACHE_TTLS.get(k[1], CACHE_TTL))
+        ]
+        for k in expired:
+            del _RESP_CACHE[k]
+        excess = len(_RESP_CACHE) - CACHE_MAX_ENTRIES * 3 // 4
+        for k in list(itertools.islice(_RESP_CACHE, max(excess, 0))):
+            del _RESP_CACHE[k]
+    _RESP_CACHE[key] = (time.monotonic(), payload)
+
+
+def _is_fresh(entry: Tuple[float, Any], ttl: float) -> bool:
+    """Whether a cache entry is still valid; empty payloads use the shorter negative TTL."""
+    fetched_at, payload = entry
+    if not payload:
+        ttl = min(ttl, NEGATIVE_CACHE_TTL)
+    return time.monotonic() - fetched_at < ttl
+
+
+def _invalidate_cache(ctx: Context, *endpoint_prefixes: str) -> None:
+    """
+    Drop the caller's cached responses whose endpoint starts with any prefix.
 
-        response.raise_for_status()
-        return response.json()
+    Tools that modify cached data (e.g., adding or completing tasks)
+    call this after a successful write. Each named endpoint also gets a new
+    generation, so reads of it already in flight don't store their results.
+
+    Args:
+        ctx: Smithery context with session config
+        endpoint_prefixes: Endpoints or prefixes to invalidate (e.g., "/todayItems");
+            in-flight reads are only discarded for exact endpoint names
+    """
+    config: AmazingMarvinConfig = ctx.session_config
+    if len(_CACHE_GENERATIONS) >= CACHE_MAX_ENTRIES:
+        # Safe to forget: in-flight reads then just skip storing
+        _CACHE_GENERATIONS.clear()
+    for endpoint in endpoint_prefixes:
+        _CACHE_GENERATIONS[(config.api_token, endpoint)] = next(_GENERATION_COUNTER)
+    stale = [
+        k for k in _RESP_CACHE
+        if k[0] == config.api_token and k[1].startswith(endpoint_prefixes)
+    ]
+    for key in stale:
+        del _RESP_CACHE[key]
 
 
 def _handle_api_error(e: Exception) -> str:
@@ -152,38 +422,124 @@ def _handle_api_error(e: Exception) -> str:
     return f"Error: Unexpected error occurred - {type(e).__name__}: {str(e)}"
 
 
-def _format_timestamp(timestamp: Optional[int], default: str = "Not set") -> str:
+def _dumps(obj: Any, pretty: bool = PRETTY_JSON) -> str:
+    """
+    Serialize a tool response to JSON.
+
+    Uses orjson when installed and the stdlib encoder otherwise; both keep
+    non-ASCII characters as-is so output matches across environments.
+
+    Args:
+        obj: JSON-serializable response payload
+        pretty: Indent with two spaces; otherwise emit compact JSON (default from MARVIN_PRETTY_JSON)
+
+    Returns:
+        str: JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _encode_body(data: Any) -> bytes:
+    """
+    Encode a POST body as compact UTF-8 JSON.
+
+    Args:
+        data: JSON-serializable request payload
+
+    Returns:
+        bytes: Encoded request body
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _build_task_data(params: "AddTaskInput") -> Dict[str, Any]:
+    """
+    Build the /addTask request body from validated input.
+
+    Optional fields are only sent when provided.
+
+    Args:
+        params: Validated task input
+
+    Returns:
+        Dict[str, Any]: Request body
+    """
+    return {
+        "title": params.title,
+        "done": False,
+        **{
+            api_key: value
+            for attr, api_key in _ADD_TASK_FIELDS
+            if (value := getattr(params, attr)) is not None
+        }
+    }
+
+
+def _today_str() -> str:
+    """Today's local date as YYYY-MM-DD, recomputed at most once per minute."""
+    minute = int(time.time()) // 60
+    if _today_cache["minute"] != minute:
+        _today_cache["date"] = datetime.now().strftime("%Y-%m-%d")
+        _today_cache["minute"] = minute
+    return _today_cache["date"]
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_timestamp(timestamp: Optional[int], default: Optional[str] = "Not set") -> Optional[str]:
     """
     Convert Unix timestamp (milliseconds) to human-readable format.
 
+    Memoized per (timestamp, default); due dates repeat heavily across tasks.
+
     Args:
         timestamp: Unix timestamp in milliseconds
         default: Default string if timestamp is None
 
     Returns:
-        Formatted date string (YYYY-MM-DD) or default
+        Formatted date string (YYYY-MM-DD, local time) or default
     """
     if not timestamp:
         return default
     try:
-        dt = datetime.fromtimestamp(timestamp / 1000)
-        return dt.strftime("%Y-%m-%d")
-    except (ValueError, OSError):
+        t = time.localtime(int(timestamp) // 1000)
+    except (ValueError, OverflowError, OSError):
         return default
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _wall_clock_ms(timestamp: int) -> int:
+    """
+    Shift a millisecond timestamp by its local UTC offset at that instant.
+
+    Differences between shifted values follow the local wall clock, so day
+    counts floor-divided from them don't slip by one across DST changes.
+    """
+    return timestamp + time.localtime(timestamp // 1000).tm_gmtoff * 1000
 
 
-def _format_time_estimate(ms: Optional[int]) -> str:
+@functools.lru_cache(maxsize=1024)
+def _format_time_estimate(ms: Optional[int], default: Optional[str] = "Not set") -> Optional[str]:
     """
     Convert time estimate in milliseconds to human-readable format.
 
+    Memoized per (ms, default); a handful of estimates cover most tasks.
+
     Args:
         ms: Time in milliseconds
+        default: Default string if ms is None or zero
 
     Returns:
-        Formatted time string (e.g., "2h 30m")
+        Formatted time string (e.g., "2h 30m") or default
     """
     if not ms:
-        return "Not set"
+        return default
 
     hours = ms // 3600000
     minutes = (ms % 3600000) // 60000
@@ -198,34 +554,427 @@ def _format_time_estimate(ms: Optional[int]) -> str:
         return "< 1m"
 
 
-def _truncate_response(content: str, items_count: int) -> str:
+def _plural(n: int, singular: str, plural: Optional[str] = None) -> str:
+    """Format a count with its noun, e.g. "1 task" or "3 tasks"."""
+    return f"{n} {singular if n == 1 else (plural or singular + 's')}"
+
+
+def _truncation_notice(shown: int, total: int, noun: str = "items") -> str:
     """
-    Truncate response if it exceeds CHARACTER_LIMIT with helpful guidance.
+    Guidance appended when a markdown list stops early at CHARACTER_LIMIT.
 
     Args:
-        content: Response content to check
-        items_count: Number of items in the response
+        shown: Number of items rendered before the limit was reached
+        total: Total number of items returned by the API
+        noun: Plural name of the listed items (e.g., "tasks", "labels")
 
     Returns:
-        Original content or truncated content with guidance
+        Notice naming how many items were left out, with next steps
     """
-    if len(content) <= CHARACTER_LIMIT:
-        return content
-
-    # Truncate to CHARACTER_LIMIT and add guidance
-    truncated = content[:CHARACTER_LIMIT]
-    last_newline = truncated.rfind('\n')
-    if last_newline > 0:
-        truncated = truncated[:last_newline]
-
-    truncated += (
-        f"\n\n---\n**Response Truncated**: Showing partial results due to size limit "
-        f"({len(content):,} characters). To see more:\n"
+    return (
+        f"\n---\n**Response Truncated**: Showing {shown} of {total} {noun} due to size "
+        f"limit ({total - shown:,} more not shown). To see more:\n"
         f"- Use pagination with `limit` and `offset` parameters\n"
         f"- Add filters to narrow down results\n"
         f"- Request specific items by ID\n"
     )
-    return truncated
+
+
+def _dumps_within_limit(response: Dict[str, Any], *keys: str, max_chars: int = CHARACTER_LIMIT) -> str:
+    """
+    Encode a JSON response, dropping trailing list items only if it exceeds max_chars.
+
+    The full response is encoded first, so lists that fit are never cut. When
+    it is too large, the largest per-list item count that fits is found by
+    bisection and "truncated": true is added, keeping the output valid JSON.
+
+    Args:
+        response: Response payload; every key in keys must hold a list
+        *keys: Keys of the lists that may be shortened
+        max_chars: Size budget for the encoded response
+
+    Returns:
+        str: JSON document of at most max_chars characters (unless even empty lists exceed it)
+    """
+    result = _dumps(response)
+    if len(result) <= max_chars:
+        return result
+
+    full = {key: response[key] for key in keys}
+    response["truncated"] = True
+
+    def encode(count: int) -> str:
+        for key in keys:
+            response[key] = full[key][:count]
+        return _dumps(response)
+
+    # Largest count in [lo, hi] whose encoding fits; count 0 always "fits"
+    lo, hi = 0, max(len(items) for items in full.values()) - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if len(encode(mid)) <= max_chars:
+            lo = mid
+        else:
+            hi = mid - 1
+    return encode(lo)
+
+
+def _render_markdown_budgeted(
+    items: List[Dict[str, Any]],
+    header: str,
+    render: Callable[[Dict[str, Any]], str],
+    noun: str = "items",
+    max_chars: int = MARKDOWN_BUDGET
+) -> str:
+    """
+    Render a list as markdown, stopping once max_chars would be exceeded.
+
+    Blocks are written straight into one StringIO buffer, so no per-line list
+    is built and nothing past the budget is rendered. Every markdown list
+    tool (tasks, categories, labels, children) goes through this.
+
+    Args:
+        items: Objects from the API
+        header: Markdown written before the first item
+        render: Renders one item as a markdown block
+        noun: Plural name of the items, used in the truncation notice
+        max_chars: Size budget for header and item blocks
+
+    Returns:
+        str: Markdown document, with a truncation notice if items were left out
+    """
+    buf = io.StringIO()
+    w = buf.write
+    w(header)
+
+    shown = len(items)
+    for index, item in enumerate(items):
+        block = render(item)
+        if buf.tell() + len(block) > max_chars:
+            shown = index
+            break
+        w(block)
+
+    result = buf.getvalue()
+    if shown < len(items):
+        result += _truncation_notice(shown, len(items), noun)
+    return result
+
+
+_TASK_FIELD_KEYS = ("_id", "title", "done", "dueDate", "timeEstimate", "parentId", "note")
+
+
+def _task_fields(task: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Look up every task field the renderers use in one pass.
+
+    Mapping the bound dict.get over the key tuple runs the loop in C and,
+    unlike operator.itemgetter, yields None for keys the API left out.
+
+    Returns:
+        Tuple of (_id, title, done, dueDate, timeEstimate, parentId, note)
+    """
+    return tuple(map(task.get, _TASK_FIELD_KEYS))
+
+
+def _today_task_md(task: Dict[str, Any]) -> str:
+    """Markdown block for one task in the today list."""
+    task_id, title, done, due, estimate, parent_id, note = _task_fields(task)
+
+    status = _EMOJI_DONE if done else _EMOJI_TODO
+    block = (
+        f"\n## {status} {'Untitled' if title is None else title}\n"
+        f"- **ID**: {'' if task_id is None else task_id}\n"
+    )
+
+    if due:
+        block += f"- **Due**: {_format_timestamp(due)}\n"
+    if estimate:
+        block += f"- **Estimate**: {_format_time_estimate(estimate)}\n"
+    if parent_id:
+        block += f"- **Project**: {parent_id}\n"
+    if note:
+        block += f"- **Note**: {note[:200]}\n"
+    return block
+
+
+def _due_task_md(task: Dict[str, Any], target_ms: int) -> str:
+    """Markdown block for one task in the due list, tagged if overdue or due today."""
+    task_id, title, done, due_ms, estimate, _, note = _task_fields(task)
+
+    status = _EMOJI_DONE if done else _EMOJI_TODO
+
+    # Tag by the sign of the day difference: overdue, due today or upcoming
+    overdue_tag = ""
+    if due_ms:
+        days_diff = (target_ms - _wall_clock_ms(int(due_ms))) // MS_PER_DAY
+        overdue_tag = _OVERDUE_TAG[(days_diff > 0) - (days_diff < 0)]
+
+    block = (
+        f"\n## {status} {'Untitled' if title is None else title}{overdue_tag}\n"
+        f"- **ID**: {'' if task_id is None else task_id}\n"
+        f"- **Due**: {_format_timestamp(due_ms)}\n"
+    )
+    if estimate:
+        block += f"- **Estimate**: {_format_time_estimate(estimate)}\n"
+    if note:
+        block += f"- **Note**: {note[:200]}\n"
+    return block
+
+
+def _task_json(task: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON view of a scheduled task; every field is present, unset ones as null."""
+    task_id, title, done, due_ms, estimate, parent_id, note = _task_fields(task)
+    return {
+        "id": task_id,
+        "title": title,
+        "done": False if done is None else done,
+        "dueDate": _format_timestamp(due_ms, default=None),
+        "timeEstimate": _format_time_estimate(estimate, default=None),
+        "parentId": parent_id,
+        "note": note
+    }
+
+
+def _due_task_json(task: Dict[str, Any], target_ms: int) -> Dict[str, Any]:
+    """JSON view of a due task, with daysOverdue when it is past due."""
+    task_id, title, done, due_ms, estimate, _, _ = _task_fields(task)
+    out = {
+        "id": task_id,
+        "title": title,
+        "done": False if done is None else done,
+        "dueDate": _format_timestamp(due_ms, default=None),
+        "timeEstimate": _format_time_estimate(estimate, default=None),
+    }
+
+    # Add days overdue if applicable
+    if due_ms:
+        days_diff = (target_ms - _wall_clock_ms(int(due_ms))) // MS_PER_DAY
+        if days_diff > 0:
+            out["daysOverdue"] = days_diff
+    return out
+
+
+def _category_json(cat: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON view of a category/project; parentId and note are omitted when unset."""
+    out = {"id": cat.get("_id"), "title": cat.get("title"), "type": cat.get("type")}
+    if cat.get("parentId"):
+        out["parentId"] = cat["parentId"]
+    if cat.get("note"):
+        out["note"] = cat["note"]
+    return out
+
+
+def _child_json(item: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON view of a child item; dueDate, timeEstimate and note are omitted when unset."""
+    out = {
+        "id": item.get("_id"),
+        "title": item.get("title"),
+        "type": item.get("type"),
+        "done": item.get("done", False)
+    }
+    if item.get("dueDate"):
+        out["dueDate"] = _format_timestamp(item["dueDate"])
+    if item.get("timeEstimate"):
+        out["timeEstimate"] = _format_time_estimate(item["timeEstimate"])
+    if item.get("note"):
+        out["note"] = item["note"]
+    return out
+
+
+def _category_md(cat: Dict[str, Any]) -> str:
+    """Markdown block for one category or project."""
+    cat_type = cat.get("type", "unknown")
+    parent_id = cat.get("parentId")
+    note = cat.get("note")
+
+    block = (
+        f"\n## {cat.get('title', 'Untitled')} ({cat_type})\n"
+        f"- **ID**: {cat.get('_id', '')}\n- **Type**: {cat_type}\n"
+    )
+    if parent_id:
+        block += f"- **Parent**: {parent_id}\n"
+    if note:
+        block += f"- **Note**: {note[:150]}\n"
+    return block
+
+
+def _format_categories_md(categories: List[Dict[str, Any]]) -> str:
+    """
+    Render categories and projects as markdown, stopping at MARKDOWN_BUDGET.
+
+    Args:
+        categories: Category/project objects from the API
+
+    Returns:
+        str: Markdown document
+    """
+    header = (
+        "# Categories & Projects\n\n"
+        f"Found {_plural(len(categories), 'category', 'categories')} and projects\n"
+    )
+    return _render_markdown_budgeted(categories, header, _category_md, "categories")
+
+
+def _format_categories_json(categories: List[Dict[str, Any]]) -> str:
+    """
+    Render categories and projects as JSON, dropping trailing items past CHARACTER_LIMIT.
+
+    Args:
+        categories: Category/project objects from the API
+
+    Returns:
+        str: JSON document
+    """
+    response = {
+        "total": len(categories),
+        "categories": [_category_json(c) for c in categories]
+    }
+    return _dumps_within_limit(response, "categories")
+
+
+def _label_md(label: Dict[str, Any]) -> str:
+    """Markdown block for one label."""
+    return f"\n## {label.get('title', 'Untitled')}\n- **ID**: {label.get('_id', '')}\n"
+
+
+def _format_labels_md(labels: List[Dict[str, Any]]) -> str:
+    """
+    Render labels as markdown, stopping at MARKDOWN_BUDGET.
+
+    Args:
+        labels: Label objects from the API
+
+    Returns:
+        str: Markdown document
+    """
+    header = f"# Labels\n\nFound {_plural(len(labels), 'label')}\n"
+    return _render_markdown_budgeted(labels, header, _label_md, "labels")
+
+
+def _format_labels_json(labels: List[Dict[str, Any]]) -> str:
+    """
+    Render labels as JSON, dropping trailing labels past CHARACTER_LIMIT.
+
+    Args:
+        labels: Label objects from the API
+
+    Returns:
+        str: JSON document
+    """
+    response = {
+        "total": len(labels),
+        "labels": [{"id": l.get("_id"), "title": l.get("title")} for l in labels]
+    }
+    return _dumps_within_limit(response, "labels")
+
+
+# Markdown template for the always-present fields of a child item
+_MD_ITEM_TEMPLATE = "\n## %s %s (%s)\n- **ID**: %s\n- **Type**: %s\n"
+
+
+def _child_md(item: Dict[str, Any]) -> str:
+    """Markdown block for one task or project under a parent."""
+    item_type = item.get("type", "task")
+    due = item.get("dueDate")
+    estimate = item.get("timeEstimate")
+    note = item.get("note")
+
+    status = _EMOJI_DONE if item.get("done") else _EMOJI_TODO
+    type_emoji = _EMOJI_PROJECT if item_type == "project" else status
+    block = _MD_ITEM_TEMPLATE % (
+        type_emoji, item.get("title", "Untitled"), item_type, item.get("_id", ""), item_type
+    )
+    if due:
+        block += f"- **Due**: {_format_timestamp(due)}\n"
+    if estimate:
+        block += f"- **Estimate**: {_format_time_estimate(estimate)}\n"
+    if note:
+        block += f"- **Note**: {note[:150]}\n"
+    return block
+
+
+def _format_children_md(parent_id: str, items: List[Dict[str, Any]]) -> str:
+    """
+    Render the items under a category or project as markdown, stopping at MARKDOWN_BUDGET.
+
+    Args:
+        parent_id: ID of the parent category/project
+        items: Child task/project objects from the API
+
+    Returns:
+        str: Markdown document
+    """
+    header = f"# Items in: {parent_id}\n\nFound {_plural(len(items), 'item')}\n"
+    return _render_markdown_budgeted(items, header, _child_md)
+
+
+def _format_children_json(parent_id: str, items: List[Dict[str, Any]]) -> str:
+    """
+    Render the items under a category or project as JSON, dropping trailing items past CHARACTER_LIMIT.
+
+    Args:
+        parent_id: ID of the parent category/project
+        items: Child task/project objects from the API
+
+    Returns:
+        str: JSON document
+    """
+    response = {
+        "parent_id": parent_id,
+        "total": len(items),
+        "items": [_child_json(i) for i in items]
+    }
+    return _dumps_within_limit(response, "items")
+
+
+def _format_taxonomy_md(categories: List[Dict[str, Any]], labels: List[Dict[str, Any]]) -> str:
+    """
+    Render categories/projects and labels as one markdown document within MARKDOWN_BUDGET.
+
+    Labels are rendered first with at most half the budget, and categories
+    get whatever is left, so a long category list can't crowd out the
+    labels section. Each section stops at a whole entry with its own notice.
+
+    Args:
+        categories: Category/project objects from the API
+        labels: Label objects from the API
+
+    Returns:
+        str: Markdown document
+    """
+    labels_md = _render_markdown_budgeted(
+        labels,
+        f"\n## Labels ({len(labels)})\n\n",
+        lambda l: f"- **{l.get('title', 'Untitled')}** - ID: {l.get('_id', '')}\n",
+        "labels",
+        max_chars=MARKDOWN_BUDGET // 2
+    )
+    categories_md = _render_markdown_budgeted(
+        categories,
+        f"# Categories, Projects & Labels\n\n## Categories & Projects ({len(categories)})\n\n",
+        lambda c: (
+            f"- **{c.get('title', 'Untitled')}** ({c.get('type', 'unknown')}) - ID: {c.get('_id', '')}\n"
+        ),
+        "categories",
+        max_chars=MARKDOWN_BUDGET - len(labels_md)
+    )
+    return categories_md + labels_md
+
+
+# Output formatters for the list tools, keyed by requested format
+_CATEGORY_FORMATTERS: Dict[ResponseFormat, Callable[[List[Dict[str, Any]]], str]] = {
+    ResponseFormat.MARKDOWN: _format_categories_md,
+    ResponseFormat.JSON: _format_categories_json,
+}
+_LABEL_FORMATTERS: Dict[ResponseFormat, Callable[[List[Dict[str, Any]]], str]] = {
+    ResponseFormat.MARKDOWN: _format_labels_md,
+    ResponseFormat.JSON: _format_labels_json,
+}
+_CHILDREN_FORMATTERS: Dict[ResponseFormat, Callable[[str, List[Dict[str, Any]]], str]] = {
+    ResponseFormat.MARKDOWN: _format_children_md,
+    ResponseFormat.JSON: _format_children_json,
+}
 
 
 # ============================================================================
@@ -298,6 +1047,16 @@ class AddTaskInput(BaseTaskInput):
     )
 
 
+class AddTasksBulkInput(BaseTaskInput):
+    """Input model for creating several tasks at once."""
+    tasks: List[AddTaskInput] = Field(
+        ...,
+        description="Tasks to create, each with the same fields as marvin_add_task",
+        min_length=1,
+        max_length=MAX_BULK_TASKS
+    )
+
+
 class GetTasksInput(BaseTaskInput):
     """Input model for retrieving tasks with optional filters."""
     date: Optional[str] = Field(
@@ -359,12 +1118,113 @@ class StartTrackingInput(BaseTaskInput):
 
 class SimpleFormatInput(BaseTaskInput):
     """Input model for simple list operations with format option."""
+    # Read-only after validation, so skip re-validating on assignment
+    model_config = ConfigDict(
+        str_strip_whitespace=True,
+        validate_assignment=False,
+        frozen=True,
+        extra='forbid'
+    )
+
     response_format: ResponseFormat = Field(
         default=ResponseFormat.MARKDOWN,
         description="Output format: 'markdown' (default) or 'json'"
     )
 
 
+# ============================================================================
+# Tool Annotations (built once at import, shared by every session)
+# ============================================================================
+
+_ANN_ADD_TASK = {
+    "title": "Add Task to Amazing Marvin",
+    "readOnlyHint": False,
+    "destructiveHint": False,
+    "idempotentHint": False,
+    "openWorldHint": True
+}
+
+_ANN_ADD_TASKS_BULK = {
+    "title": "Add Multiple Tasks to Amazing Marvin",
+    "readOnlyHint": False,
+    "destructiveHint": False,
+    "idempotentHint": False,
+    "openWorldHint": True
+}
+
+_ANN_GET_TODAYS_TASKS = {
+    "title": "Get Today's Tasks",
+    "readOnlyHint": True,
+    "destructiveHint": False,
+    "idempotentHint": True,
+    "openWorldHint": True
+}
+
+_ANN_MARK_DONE = {
+    "title": "Mark Task as Done",
+    "readOnlyHint": False,
+    "destructiveHint": False,
+    "idempotentHint": True,
+    "openWorldHint": True
+}
+
+_ANN_GET_DUE_TASKS = {
+    "title": "Get Due and Overdue Tasks",
+    "readOnlyHint": True,
+    "destructiveHint": False,
+    "idempotentHint": True,
+    "openWorldHint": True
+}
+
+_ANN_GET_CATEGORIES = {
+    "title": "List All Categories and Projects",
+    "readOnlyHint": True,
+    "destructiveHint": False,
+    "idempotentHint": True,
+    "openWorldHint": True
+}
+
+_ANN_GET_LABELS = {
+    "title": "List All Labels",
+    "readOnlyHint": True,
+    "destructiveHint": False,
+    "idempotentHint": True,
+    "openWorldHint": True
+}
+
+_ANN_GET_TAXONOMY = {
+    "title": "List All Categories, Projects and Labels",
+    "readOnlyHint": True,
+    "destructiveHint": False,
+    "idempotentHint": True,
+    "openWorldHint": True
+}
+
+_ANN_GET_CHILDREN = {
+    "title": "Get Items in Category/Project",
+    "readOnlyHint": True,
+    "destructiveHint": False,
+    "idempotentHint": True,
+    "openWorldHint": True
+}
+
+_ANN_START_TRACKING = {
+    "title": "Start Time Tracking",
+    "readOnlyHint": False,
+    "destructiveHint": False,
+    "idempotentHint": False,
+    "openWorldHint": True
+}
+
+_ANN_STOP_TRACKING = {
+    "title": "Stop Time Tracking",
+    "readOnlyHint": False,
+    "destructiveHint": False,
+    "idempotentHint": True,
+    "openWorldHint": True
+}
+
+
 # ============================================================================
 # Server Creation Function with Smithery Decorator
 # ============================================================================
@@ -380,22 +1240,13 @@ def create_server():
     Returns:
         Configured FastMCP server instance
     """
-    mcp = FastMCP("amazing_marvin_mcp")
+    mcp = FastMCP("amazing_marvin_mcp", lifespan=_lifespan)
 
     # ============================================================================
     # Tool Implementations - Tier 1: Essential Task Management
     # ============================================================================
 
-    @mcp.tool(
-        name="marvin_add_task",
-        annotations={
-            "title": "Add Task to Amazing Marvin",
-            "readOnlyHint": False,
-            "destructiveHint": False,
-            "idempotentHint": False,
-            "openWorldHint": True
-        }
-    )
+    @mcp.tool(name="marvin_add_task", annotations=_ANN_ADD_TASK)
     async def marvin_add_task(params: AddTaskInput, ctx: Context) -> str:
         """
         Create a new task in Amazing Marvin with full support for scheduling, labels, and organization.
@@ -411,30 +1262,10 @@ def create_server():
             str: Success message with task ID and title, or error message
         """
         try:
-            # Build task data from validated input
-            task_data = {
-                "title": params.title,
-                "done": False
-            }
-
-            # Add optional fields if provided
-            if params.note is not None:
-                task_data["note"] = params.note
-            if params.day is not None:
-                task_data["day"] = params.day
-            if params.due_date is not None:
-                task_data["dueDate"] = params.due_date
-            if params.parent_id is not None:
-                task_data["parentId"] = params.parent_id
-            if params.label_ids is not None:
-                task_data["labelIds"] = params.label_ids
-            if params.time_estimate is not None:
-                task_data["timeEstimate"] = params.time_estimate
-            if params.is_starred is not None:
-                task_data["isStarred"] = params.is_starred
-
             # Make API request
+            task_data = _build_task_data(params)
             result = await _make_api_request("/addTask", ctx, method="POST", data=task_data)
+            _invalidate_cache(ctx, *TASK_LIST_ENDPOINTS)
 
             # Format success response
             lines = [
@@ -456,16 +1287,59 @@ def create_server():
         except Exception as e:
             return _handle_api_error(e)
 
-    @mcp.tool(
-        name="marvin_get_todays_tasks",
-        annotations={
-            "title": "Get Today's Tasks",
-            "readOnlyHint": True,
-            "destructiveHint": False,
-            "idempotentHint": True,
-            "openWorldHint": True
-        }
-    )
+    @mcp.tool(name="marvin_add_tasks_bulk", annotations=_ANN_ADD_TASKS_BULK)
+    async def marvin_add_tasks_bulk(params: AddTasksBulkInput, ctx: Context) -> str:
+        """
+        Create several tasks in Amazing Marvin in one call.
+
+        Use this instead of repeated marvin_add_task calls when importing a list;
+        the tasks are sent concurrently over the shared HTTP/2 connection, at
+        most BULK_CONCURRENCY at a time so the API's rate limit isn't tripped
+        (POSTs are not retried).
+        Each task accepts the same fields and shortcuts as marvin_add_task.
+
+        Args:
+            params (AddTasksBulkInput): Validated input parameters
+            ctx (Context): Smithery context with session configuration
+
+        Returns:
+            str: Summary with the ID of each created task and any per-task errors
+        """
+        try:
+            semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+            async def add_one(task: AddTaskInput) -> Any:
+                async with semaphore:
+                    return await _make_api_request(
+                        "/addTask", ctx, method="POST", data=_build_task_data(task)
+                    )
+
+            results = await asyncio.gather(
+                *[add_one(t) for t in params.tasks],
+                return_exceptions=True
+            )
+
+            created = sum(1 for r in results if not isinstance(r, BaseException))
+            if created:
+                _invalidate_cache(ctx, *TASK_LIST_ENDPOINTS)
+
+            # Format summary in input order
+            lines = [
+                f"{'✅' if created == len(results) else '⚠️'} Created {created} of {_plural(len(results), 'task')}",
+                ""
+            ]
+            for task, result in zip(params.tasks, results):
+                if isinstance(result, BaseException):
+                    lines.append(f"- ✗ {task.title}: {_handle_api_error(result)}")
+                else:
+                    lines.append(f"- {result.get('title', task.title)} (**ID**: {result.get('_id', 'N/A')})")
+
+            return "\n".join(lines)
+
+        except Exception as e:
+            return _handle_api_error(e)
+
+    @mcp.tool(name="marvin_get_todays_tasks", annotations=_ANN_GET_TODAYS_TASKS)
     async def marvin_get_todays_tasks(params: GetTasksInput, ctx: Context) -> str:
         """
         Retrieve all tasks scheduled for today (or a specific date) in Amazing Marvin.
@@ -479,10 +1353,10 @@ def create_server():
         """
         try:
             # Use provided date or default to today
-            target_date = params.date or datetime.now().strftime("%Y-%m-%d")
+            target_date = params.date or _today_str()
 
             # Make API request
-            tasks = await _make_api_request(
+            tasks = await _cached_api_get(
                 "/todayItems",
                 ctx,
                 params={"date": target_date}
@@ -492,70 +1366,25 @@ def create_server():
                 return f"No tasks scheduled for {target_date}."
 
             # Format response based on requested format
-            if params.response_format == ResponseFormat.MARKDOWN:
-                lines = [
-                    f"# Today's Tasks ({target_date})",
-                    "",
-                    f"Found {len(tasks)} task{'s' if len(tasks) != 1 else ''}",
-                    ""
-                ]
-
-                for task in tasks:
-                    status = "✅" if task.get("done") else "⬜"
-                    title = task.get("title", "Untitled")
-                    task_id = task.get("_id", "")
-
-                    lines.append(f"## {status} {title}")
-                    lines.append(f"- **ID**: {task_id}")
-
-                    if task.get("dueDate"):
-                        lines.append(f"- **Due**: {_format_timestamp(task.get('dueDate'))}")
-                    if task.get("timeEstimate"):
-                        lines.append(f"- **Estimate**: {_format_time_estimate(task.get('timeEstimate'))}")
-                    if task.get("parentId"):
-                        lines.append(f"- **Project**: {task.get('parentId')}")
-                    if task.get("note"):
-                        note = task.get("note", "")[:200]
-                        lines.append(f"- **Note**: {note}")
-
-                    lines.append("")
-
-                result = "\n".join(lines)
-                return _truncate_response(result, len(tasks))
+            if params.response_format is ResponseFormat.MARKDOWN:
+                header = (
+                    f"# Today's Tasks ({target_date})\n\n"
+                    f"Found {_plural(len(tasks), 'task')}\n"
+                )
+                return _render_markdown_budgeted(tasks, header, _today_task_md, "tasks")
 
             else:  # JSON format
                 response = {
                     "date": target_date,
                     "total": len(tasks),
-                    "tasks": [
-                        {
-                            "id": t.get("_id"),
-                            "title": t.get("title"),
-                            "done": t.get("done", False),
-                            "dueDate": _format_timestamp(t.get("dueDate")) if t.get("dueDate") else None,
-                            "timeEstimate": _format_time_estimate(t.get("timeEstimate")) if t.get("timeEstimate") else None,
-                            "parentId": t.get("parentId"),
-                            "note": t.get("note")
-                        }
-                        for t in tasks
-                    ]
+                    "tasks": [_task_json(t) for t in tasks]
                 }
-                result = json.dumps(response, indent=2)
-                return _truncate_response(result, len(tasks))
+                return _dumps_within_limit(response, "tasks")
 
         except Exception as e:
             return _handle_api_error(e)
 
-    @mcp.tool(
-        name="marvin_mark_done",
-        annotations={
-            "title": "Mark Task as Done",
-            "readOnlyHint": False,
-            "destructiveHint": False,
-            "idempotentHint": True,
-            "openWorldHint": True
-        }
-    )
+    @mcp.tool(name="marvin_mark_done", annotations=_ANN_MARK_DONE)
     async def marvin_mark_done(params: MarkDoneInput, ctx: Context) -> str:
         """
         Mark a specific task as complete in Amazing Marvin.
@@ -575,6 +1404,7 @@ def create_server():
                 method="POST",
                 data={"itemId": params.item_id}
             )
+            _invalidate_cache(ctx, *TASK_LIST_ENDPOINTS)
 
             return (
                 f"✅ Task marked as complete!\n\n"
@@ -584,16 +1414,7 @@ def create_server():
         except Exception as e:
             return _handle_api_error(e)
 
-    @mcp.tool(
-        name="marvin_get_due_tasks",
-        annotations={
-            "title": "Get Due and Overdue Tasks",
-            "readOnlyHint": True,
-            "destructiveHint": False,
-            "idempotentHint": True,
-            "openWorldHint": True
-        }
-    )
+    @mcp.tool(name="marvin_get_due_tasks", annotations=_ANN_GET_DUE_TASKS)
     async def marvin_get_due_tasks(params: GetTasksInput, ctx: Context) -> str:
         """
         Get all tasks that are due today or overdue in Amazing Marvin.
@@ -607,10 +1428,10 @@ def create_server():
         """
         try:
             # Use provided date or default to today
-            target_date = params.date or datetime.now().strftime("%Y-%m-%d")
+            target_date = params.date or _today_str()
 
             # Make API request
-            tasks = await _make_api_request(
+            tasks = await _cached_api_get(
                 "/dueItems",
                 ctx,
                 params={"by": target_date}
@@ -619,76 +1440,27 @@ def create_server():
             if not tasks:
                 return f"No due or overdue tasks as of {target_date}."
 
-            # Calculate days overdue for each task
+            # Calculate days overdue for each task against local midnight of the target date
             target_dt = datetime.strptime(target_date, "%Y-%m-%d")
+            target_ms = _wall_clock_ms(int(target_dt.timestamp() * 1000))
 
             # Format response based on requested format
-            if params.response_format == ResponseFormat.MARKDOWN:
-                lines = [
-                    f"# Due & Overdue Tasks (as of {target_date})",
-                    "",
-                    f"Found {len(tasks)} task{'s' if len(tasks) != 1 else ''} requiring attention",
-                    ""
-                ]
-
-                for task in tasks:
-                    status = "✅" if task.get("done") else "⬜"
-                    title = task.get("title", "Untitled")
-                    task_id = task.get("_id", "")
-                    due_date_str = _format_timestamp(task.get("dueDate"))
-
-                    # Calculate if overdue
-                    overdue_tag = ""
-                    if task.get("dueDate"):
-                        due_dt = datetime.fromtimestamp(task.get("dueDate") / 1000)
-                        days_diff = (target_dt - due_dt).days
-                        if days_diff > 0:
-                            overdue_tag = " [OVERDUE]"
-                        elif days_diff == 0:
-                            overdue_tag = " [DUE TODAY]"
-
-                    lines.append(f"## {status} {title}{overdue_tag}")
-                    lines.append(f"- **ID**: {task_id}")
-                    lines.append(f"- **Due**: {due_date_str}")
-
-                    if task.get("timeEstimate"):
-                        lines.append(f"- **Estimate**: {_format_time_estimate(task.get('timeEstimate'))}")
-                    if task.get("note"):
-                        note = task.get("note", "")[:200]
-                        lines.append(f"- **Note**: {note}")
-
-                    lines.append("")
-
-                result = "\n".join(lines)
-                return _truncate_response(result, len(tasks))
+            if params.response_format is ResponseFormat.MARKDOWN:
+                header = (
+                    f"# Due & Overdue Tasks (as of {target_date})\n\n"
+                    f"Found {_plural(len(tasks), 'task')} requiring attention\n"
+                )
+                return _render_markdown_budgeted(
+                    tasks, header, lambda task: _due_task_md(task, target_ms), "tasks"
+                )
 
             else:  # JSON format
                 response = {
                     "asOf": target_date,
                     "total": len(tasks),
-                    "tasks": []
+                    "tasks": [_due_task_json(t, target_ms) for t in tasks]
                 }
-
-                for task in tasks:
-                    task_data = {
-                        "id": task.get("_id"),
-                        "title": task.get("title"),
-                        "done": task.get("done", False),
-                        "dueDate": _format_timestamp(task.get("dueDate")) if task.get("dueDate") else None,
-                        "timeEstimate": _format_time_estimate(task.get("timeEstimate")) if task.get("timeEstimate") else None,
-                    }
-
-                    # Add days overdue if applicable
-                    if task.get("dueDate"):
-                        due_dt = datetime.fromtimestamp(task.get("dueDate") / 1000)
-                        days_diff = (target_dt - due_dt).days
-                        if days_diff > 0:
-                            task_data["daysOverdue"] = days_diff
-
-                    response["tasks"].append(task_data)
-
-                result = json.dumps(response, indent=2)
-                return _truncate_response(result, len(tasks))
+                return _dumps_within_limit(response, "tasks")
 
         except Exception as e:
             return _handle_api_error(e)
@@ -697,20 +1469,13 @@ def create_server():
     # Tool Implementations - Tier 2: Organization & Context
     # ============================================================================
 
-    @mcp.tool(
-        name="marvin_get_categories",
-        annotations={
-            "title": "List All Categories and Projects",
-            "readOnlyHint": True,
-            "destructiveHint": False,
-            "idempotentHint": True,
-            "openWorldHint": True
-        }
-    )
+    @mcp.tool(name="marvin_get_categories", annotations=_ANN_GET_CATEGORIES)
     async def marvin_get_categories(params: SimpleFormatInput, ctx: Context) -> str:
         """
         List all categories and projects in Amazing Marvin to help identify parent IDs.
 
+        Use marvin_get_taxonomy instead when label IDs are needed as well.
+
         Args:
             params (SimpleFormatInput): Validated input parameters
             ctx (Context): Smithery context with session configuration
@@ -720,74 +1485,27 @@ def create_server():
         """
         try:
             # Make API request
-            categories = await _make_api_request("/categories", ctx)
+            categories = await _cached_api_get("/categories", ctx)
 
             if not categories:
                 return "No categories or projects found."
 
             # Format response based on requested format
-            if params.response_format == ResponseFormat.MARKDOWN:
-                lines = [
-                    "# Categories & Projects",
-                    "",
-                    f"Found {len(categories)} categor{'ies' if len(categories) != 1 else 'y'} and projects",
-                    ""
-                ]
-
-                for cat in categories:
-                    title = cat.get("title", "Untitled")
-                    cat_id = cat.get("_id", "")
-                    cat_type = cat.get("type", "unknown")
-
-                    lines.append(f"## {title} ({cat_type})")
-                    lines.append(f"- **ID**: {cat_id}")
-                    lines.append(f"- **Type**: {cat_type}")
-
-                    if cat.get("parentId"):
-                        lines.append(f"- **Parent**: {cat.get('parentId')}")
-                    if cat.get("note"):
-                        note = cat.get("note", "")[:150]
-                        lines.append(f"- **Note**: {note}")
-
-                    lines.append("")
-
-                result = "\n".join(lines)
-                return _truncate_response(result, len(categories))
-
-            else:  # JSON format
-                response = {
-                    "total": len(categories),
-                    "categories": [
-                        {
-                            "id": c.get("_id"),
-                            "title": c.get("title"),
-                            "type": c.get("type"),
-                            "parentId": c.get("parentId"),
-                            "note": c.get("note")
-                        }
-                        for c in categories
-                    ]
-                }
-                result = json.dumps(response, indent=2)
-                return _truncate_response(result, len(categories))
+            formatter = _CATEGORY_FORMATTERS[params.response_format]
+            if len(categories) > TO_THREAD_THRESHOLD:
+                return await asyncio.to_thread(formatter, categories)
+            return formatter(categories)
 
         except Exception as e:
             return _handle_api_error(e)
 
-    @mcp.tool(
-        name="marvin_get_labels",
-        annotations={
-            "title": "List All Labels",
-            "readOnlyHint": True,
-            "destructiveHint": False,
-            "idempotentHint": True,
-            "openWorldHint": True
-        }
-    )
+    @mcp.tool(name="marvin_get_labels", annotations=_ANN_GET_LABELS)
     async def marvin_get_labels(params: SimpleFormatInput, ctx: Context) -> str:
         """
         List all labels in Amazing Marvin to help identify label IDs for task creation.
 
+        Use marvin_get_taxonomy instead when category or project IDs are needed as well.
+
         Args:
             params (SimpleFormatInput): Validated input parameters
             ctx (Context): Smithery context with session configuration
@@ -797,34 +1515,59 @@ def create_server():
         """
         try:
             # Make API request
-            labels = await _make_api_request("/labels", ctx)
+            labels = await _cached_api_get("/labels", ctx)
 
             if not labels:
                 return "No labels found."
 
             # Format response based on requested format
-            if params.response_format == ResponseFormat.MARKDOWN:
-                lines = [
-                    "# Labels",
-                    "",
-                    f"Found {len(labels)} label{'s' if len(labels) != 1 else ''}",
-                    ""
-                ]
+            return _LABEL_FORMATTERS[params.response_format](labels)
+
+        except Exception as e:
+            return _handle_api_error(e)
 
-                for label in labels:
-                    title = label.get("title", "Untitled")
-                    label_id = label.get("_id", "")
+    @mcp.tool(name="marvin_get_taxonomy", annotations=_ANN_GET_TAXONOMY)
+    async def marvin_get_taxonomy(params: SimpleFormatInput, ctx: Context) -> str:
+        """
+        List all categories, projects and labels in Amazing Marvin in one call.
 
-                    lines.append(f"## {title}")
-                    lines.append(f"- **ID**: {label_id}")
-                    lines.append("")
+        Prefer this over calling marvin_get_categories and marvin_get_labels
+        separately when preparing task creation; both lists are fetched in parallel.
 
-                result = "\n".join(lines)
-                return _truncate_response(result, len(labels))
+        Args:
+            params (SimpleFormatInput): Validated input parameters
+            ctx (Context): Smithery context with session configuration
+
+        Returns:
+            str: Categories/projects and labels formatted as markdown or JSON
+        """
+        try:
+            # Fetch both lists concurrently
+            categories, labels = await asyncio.gather(
+                _cached_api_get("/categories", ctx),
+                _cached_api_get("/labels", ctx)
+            )
+            categories = categories or []
+            labels = labels or []
+
+            if not categories and not labels:
+                return "No categories, projects or labels found."
+
+            # Format response based on requested format
+            if params.response_format is ResponseFormat.MARKDOWN:
+                return _format_taxonomy_md(categories, labels)
 
             else:  # JSON format
                 response = {
-                    "total": len(labels),
+                    "categories": [
+                        {
+                            "id": c.get("_id"),
+                            "title": c.get("title"),
+                            "type": c.get("type"),
+                            "parentId": c.get("parentId")
+                        }
+                        for c in categories
+                    ],
                     "labels": [
                         {
                             "id": l.get("_id"),
@@ -833,22 +1576,12 @@ def create_server():
                         for l in labels
                     ]
                 }
-                result = json.dumps(response, indent=2)
-                return _truncate_response(result, len(labels))
+                return _dumps_within_limit(response, "categories", "labels")
 
         except Exception as e:
             return _handle_api_error(e)
 
-    @mcp.tool(
-        name="marvin_get_children",
-        annotations={
-            "title": "Get Items in Category/Project",
-            "readOnlyHint": True,
-            "destructiveHint": False,
-            "idempotentHint": True,
-            "openWorldHint": True
-        }
-    )
+    @mcp.tool(name="marvin_get_children", annotations=_ANN_GET_CHILDREN)
     async def marvin_get_children(params: GetChildrenInput, ctx: Context) -> str:
         """
         Get all tasks and projects within a specific category or project in Amazing Marvin.
@@ -862,7 +1595,7 @@ def create_server():
         """
         try:
             # Make API request
-            items = await _make_api_request(
+            items = await _cached_api_get(
                 "/children",
                 ctx,
                 params={"parentId": params.parent_id}
@@ -872,57 +1605,10 @@ def create_server():
                 return f"No items found under parent ID: {params.parent_id}"
 
             # Format response based on requested format
-            if params.response_format == ResponseFormat.MARKDOWN:
-                lines = [
-                    f"# Items in: {params.parent_id}",
-                    "",
-                    f"Found {len(items)} item{'s' if len(items) != 1 else ''}",
-                    ""
-                ]
-
-                for item in items:
-                    status = "✅" if item.get("done") else "⬜"
-                    title = item.get("title", "Untitled")
-                    item_type = item.get("type", "task")
-                    item_id = item.get("_id", "")
-
-                    type_emoji = "📁" if item_type == "project" else status
-                    lines.append(f"## {type_emoji} {title} ({item_type})")
-                    lines.append(f"- **ID**: {item_id}")
-                    lines.append(f"- **Type**: {item_type}")
-
-                    if item.get("dueDate"):
-                        lines.append(f"- **Due**: {_format_timestamp(item.get('dueDate'))}")
-                    if item.get("timeEstimate"):
-                        lines.append(f"- **Estimate**: {_format_time_estimate(item.get('timeEstimate'))}")
-                    if item.get("note"):
-                        note = item.get("note", "")[:150]
-                        lines.append(f"- **Note**: {note}")
-
-                    lines.append("")
-
-                result = "\n".join(lines)
-                return _truncate_response(result, len(items))
-
-            else:  # JSON format
-                response = {
-                    "parent_id": params.parent_id,
-                    "total": len(items),
-                    "items": [
-                        {
-                            "id": i.get("_id"),
-                            "title": i.get("title"),
-                            "type": i.get("type"),
-                            "done": i.get("done", False),
-                            "dueDate": _format_timestamp(i.get("dueDate")) if i.get("dueDate") else None,
-                            "timeEstimate": _format_time_estimate(i.get("timeEstimate")) if i.get("timeEstimate") else None,
-                            "note": i.get("note")
-                        }
-                        for i in items
-                    ]
-                }
-                result = json.dumps(response, indent=2)
-                return _truncate_response(result, len(items))
+            formatter = _CHILDREN_FORMATTERS[params.response_format]
+            if len(items) > TO_THREAD_THRESHOLD:
+                return await asyncio.to_thread(formatter, params.parent_id, items)
+            return formatter(params.parent_id, items)
 
         except Exception as e:
             return _handle_api_error(e)
@@ -931,16 +1617,7 @@ def create_server():
     # Tool Implementations - Tier 3: Time Management
     # ============================================================================
 
-    @mcp.tool(
-        name="marvin_start_tracking",
-        annotations={
-            "title": "Start Time Tracking",
-            "readOnlyHint": False,
-            "destructiveHint": False,
-            "idempotentHint": False,
-            "openWorldHint": True
-        }
-    )
+    @mcp.tool(name="marvin_start_tracking", annotations=_ANN_START_TRACKING)
     async def marvin_start_tracking(params: StartTrackingInput, ctx: Context) -> str:
         """
         Start time tracking for a specific task in Amazing Marvin.
@@ -970,16 +1647,7 @@ def create_server():
         except Exception as e:
             return _handle_api_error(e)
 
-    @mcp.tool(
-        name="marvin_stop_tracking",
-        annotations={
-            "title": "Stop Time Tracking",
-            "readOnlyHint": False,
-            "destructiveHint": False,
-            "idempotentHint": True,
-            "openWorldHint": True
-        }
-    )
+    @mcp.tool(name="marvin_stop_tracking", annotations=_ANN_STOP_TRACKING)
     async def marvin_stop_tracking(ctx: Context) -> str:
         """
         Stop the currently running time tracker in Amazing Marvin.
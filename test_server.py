@@ -14,39 +14,25 @@ import httpx
 MARVIN_API_BASE = "https://serv.amazingmarvin.com/api"
 
 
-async def test_connection():
+async def check_connection(client: httpx.AsyncClient):
     """Test connection to Amazing Marvin API"""
-    api_token = os.getenv("AMAZING_MARVIN_API_TOKEN")
-    
-    if not api_token:
-        print("❌ ERROR: AMAZING_MARVIN_API_TOKEN environment variable not set")
-        print("\nPlease set your API token:")
-        print("  export AMAZING_MARVIN_API_TOKEN='your-token-here'")
-        return False
-    
-    print(f"✓ API token found: {api_token[:10]}...")
-    
     # Test API connection
     print("\n🔄 Testing connection to Amazing Marvin API...")
     
     try:
-        async with httpx.AsyncClient() as client:
-            # Test with categories endpoint (simple read operation)
-            response = await client.get(
-                f"{MARVIN_API_BASE}/categories",
-                headers={"X-API-Token": api_token}
-            )
+        # Test with categories endpoint (simple read operation)
+        response = await client.get("/categories")
+        
+        if response.status_code == 200:
+            print("✅ Successfully connected to Amazing Marvin!")
+            categories = response.json()
+            print(f"   Found {len(categories)} categories/projects")
+            return True
+        else:
+            print(f"❌ Connection failed with status code: {response.status_code}")
+            print(f"   Response: {response.text}")
+            return False
             
-            if response.status_code == 200:
-                print("✅ Successfully connected to Amazing Marvin!")
-                categories = response.json()
-                print(f"   Found {len(categories)} categories/projects")
-                return True
-            else:
-                print(f"❌ Connection failed with status code: {response.status_code}")
-                print(f"   Response: {response.text}")
-                return False
-                
     except httpx.HTTPError as e:
         print(f"❌ Connection error: {e}")
         return False
@@ -55,41 +41,55 @@ async def test_connection():
         return False
 
 
-async def test_features():
+async def probe_labels(client: httpx.AsyncClient):
+    """Probe the labels endpoint"""
+    try:
+        response = await client.get("/labels")
+        labels = response.json()
+        return f"   ✓ Found {len(labels)} labels"
+    except Exception as e:
+        return f"   ✗ Labels test failed: {e}"
+
+
+async def probe_today(client: httpx.AsyncClient):
+    """Probe the today's tasks endpoint"""
+    try:
+        response = await client.get("/todayItems")
+        tasks = response.json()
+        return f"   ✓ Found {len(tasks)} tasks for today"
+    except Exception as e:
+        return f"   ✗ Today's tasks test failed: {e}"
+
+
+async def probe_due(client: httpx.AsyncClient):
+    """Probe the due tasks endpoint"""
+    try:
+        response = await client.get("/dueItems")
+        due_tasks = response.json()
+        return f"   ✓ Found {len(due_tasks)} due/overdue tasks"
+    except Exception as e:
+        return f"   ✗ Due tasks test failed: {e}"
+
+
+async def check_features(client: httpx.AsyncClient):
     """Test various API features"""
-    api_token = os.getenv("AMAZING_MARVIN_API_TOKEN")
-    
     print("\n🧪 Testing API features...\n")
     
-    async with httpx.AsyncClient() as client:
-        headers = {"X-API-Token": api_token}
-        
-        # Test 1: Get labels
-        print("1. Testing labels endpoint...")
-        try:
-            response = await client.get(f"{MARVIN_API_BASE}/labels", headers=headers)
-            labels = response.json()
-            print(f"   ✓ Found {len(labels)} labels")
-        except Exception as e:
-            print(f"   ✗ Labels test failed: {e}")
-        
-        # Test 2: Get today's tasks
-        print("2. Testing today's tasks endpoint...")
-        try:
-            response = await client.get(f"{MARVIN_API_BASE}/todayItems", headers=headers)
-            tasks = response.json()
-            print(f"   ✓ Found {len(tasks)} tasks for today")
-        except Exception as e:
-            print(f"   ✗ Today's tasks test failed: {e}")
-        
-        # Test 3: Check due tasks
-        print("3. Testing due tasks endpoint...")
-        try:
-            response = await client.get(f"{MARVIN_API_BASE}/dueItems", headers=headers)
-            due_tasks = response.json()
-            print(f"   ✓ Found {len(due_tasks)} due/overdue tasks")
-        except Exception as e:
-            print(f"   ✗ Due tasks test failed: {e}")
+    # The probes are independent, so run them concurrently and report in order
+    results = await asyncio.gather(
+        probe_labels(client),
+        probe_today(client),
+        probe_due(client)
+    )
+    
+    titles = [
+        "1. Testing labels endpoint...",
+        "2. Testing today's tasks endpoint...",
+        "3. Testing due tasks endpoint...",
+    ]
+    for title, result in zip(titles, results):
+        print(title)
+        print(result)
 
 
 async def main():
@@ -98,10 +98,26 @@ async def main():
     print("Amazing Marvin MCP Server - Connection Test")
     print("=" * 50)
     
-    success = await test_connection()
+    api_token = os.getenv("AMAZING_MARVIN_API_TOKEN")
+    
+    if not api_token:
+        print("❌ ERROR: AMAZING_MARVIN_API_TOKEN environment variable not set")
+        print("\nPlease set your API token:")
+        print("  export AMAZING_MARVIN_API_TOKEN='your-token-here'")
+        success = False
+    else:
+        print(f"✓ API token found: {api_token[:10]}...")
+        
+        # One keep-alive client so every probe reuses the same TCP/TLS connection
+        async with httpx.AsyncClient(
+            base_url=MARVIN_API_BASE,
+            headers={"X-API-Token": api_token}
+        ) as client:
+            success = await check_connection(client)
+            if success:
+                await check_features(client)
     
     if success:
-        await test_features()
         print("\n" + "=" * 50)
         print("✅ All tests passed! Your setup is ready.")
         print("=" * 50)
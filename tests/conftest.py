@@ -0,0 +1,45 @@
+"""Shared pytest setup for the Amazing Marvin MCP servers."""
+
+import os
+import sys
+import time
+
+import pytest
+
+# The STDIO server lives at the repo root and the Smithery package under src/
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+
+def _clear_local_time_caches():
+    """Forget memoized results that depend on the local timezone, in both servers."""
+    import amazing_marvin_server
+    from amazing_marvin_mcp import server
+
+    for fn in (
+        amazing_marvin_server._format_timestamp_cached,
+        amazing_marvin_server._wall_clock_ms,
+        amazing_marvin_server._format_time_estimate_cached,
+        server._format_timestamp,
+        server._wall_clock_ms,
+        server._format_time_estimate,
+    ):
+        fn.cache_clear()
+    server._today_cache["minute"] = -1
+
+
+@pytest.fixture
+def new_york_tz():
+    """Run a test in America/New_York, which changes to DST on 2024-03-10."""
+    previous = os.environ.get("TZ")
+    os.environ["TZ"] = "America/New_York"
+    time.tzset()
+    _clear_local_time_caches()
+    yield
+    if previous is None:
+        del os.environ["TZ"]
+    else:
+        os.environ["TZ"] = previous
+    time.tzset()
+    _clear_local_time_caches()
@@ -0,0 +1,189 @@
+"""Offline tests for the Smithery server (src/amazing_marvin_mcp/server.py)."""
+
+import asyncio
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from amazing_marvin_mcp import server
+
+
+def _categories(count: int, note: str = ""):
+    """Category objects shaped like the /categories response."""
+    return [
+        {"_id": f"cat{i}", "title": f"Category {i}", "type": "category", "note": note}
+        for i in range(count)
+    ]
+
+
+def test_categories_json_keeps_every_item_that_fits():
+    result = server._format_categories_json(_categories(300))
+
+    assert len(result) <= server.CHARACTER_LIMIT
+    response = json.loads(result)
+    assert response["total"] == 300
+    assert len(response["categories"]) == 300
+    assert "truncated" not in response
+
+
+def test_categories_json_drops_trailing_items_past_limit():
+    result = server._format_categories_json(_categories(400, note="x" * 200))
+
+    assert len(result) <= server.CHARACTER_LIMIT
+    response = json.loads(result)
+    shown = response["categories"]
+    assert response["truncated"] is True
+    assert 0 < len(shown) < 400
+    assert shown[-1]["id"] == f"cat{len(shown) - 1}"
+
+
+def test_due_tasks_count_days_across_dst_change(new_york_tz):
+
+    def midnight_ms(day: str) -> int:
+        return int(datetime.strptime(day, "%Y-%m-%d").timestamp() * 1000)
+
+    target_ms = server._wall_clock_ms(midnight_ms("2024-03-11"))
+    overdue = {
+        day: server._due_task_json({"_id": day, "dueDate": midnight_ms(day)}, target_ms).get("daysOverdue")
+        for day in ("2024-03-05", "2024-03-10", "2024-03-11")
+    }
+    assert overdue == {"2024-03-05": 6, "2024-03-10": 1, "2024-03-11": None}
+
+    yesterday = {"_id": "t", "title": "Yesterday", "dueDate": midnight_ms("2024-03-10")}
+    assert "Yesterday [OVERDUE]" in server._due_task_md(yesterday, target_ms)
+
+
+def test_taxonomy_markdown_keeps_labels_when_categories_overflow():
+    labels = [{"_id": f"label{i}", "title": f"Label {i}"} for i in range(20)]
+
+    result = server._format_taxonomy_md(_categories(1000), labels)
+
+    assert len(result) <= server.CHARACTER_LIMIT + 500  # Budget plus one truncation notice
+    categories_md, labels_md = result.split("\n## Labels (20)\n\n")
+    assert "Showing" in categories_md and "of 1000 categories" in categories_md
+    assert labels_md.count("- **Label") == 20
+    # Every rendered entry is whole; the cut falls between entries
+    entries = [line for line in categories_md.splitlines() if line.startswith("- **")]
+    assert entries[-1] == f"- **Category {len(entries) - 1}** (category) - ID: cat{len(entries) - 1}"
+
+
+def _ctx(token: str = "token"):
+    """Minimal stand-in for the Smithery request context."""
+    return SimpleNamespace(session_config=SimpleNamespace(api_token=token))
+
+
+async def test_cache_stays_bounded_and_releases_locks_on_failure(monkeypatch):
+    monkeypatch.setattr(server, "_RESP_CACHE", {})
+    monkeypatch.setattr(server, "_CACHE_LOCKS", {})
+
+    async def fake_request(endpoint, ctx, method="GET", data=None, params=None, full_access=False):
+        if params and params.get("date") == "fail":
+            raise RuntimeError("API down")
+        return [params]
+
+    monkeypatch.setattr(server, "_make_api_request", fake_request)
+
+    for day in range(server.CACHE_MAX_ENTRIES * 2):
+        await server._cached_api_get("/todayItems", _ctx(), params={"date": str(day)})
+    assert len(server._RESP_CACHE) <= server.CACHE_MAX_ENTRIES
+
+    with pytest.raises(RuntimeError):
+        await server._cached_api_get("/todayItems", _ctx(), params={"date": "fail"})
+    assert server._CACHE_LOCKS == {}
+
+
+async def test_concurrent_misses_share_one_request(monkeypatch):
+    monkeypatch.setattr(server, "_RESP_CACHE", {})
+    monkeypatch.setattr(server, "_CACHE_LOCKS", {})
+    calls = 0
+
+    async def fake_request(endpoint, ctx, method="GET", data=None, params=None, full_access=False):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return ["label"]
+
+    monkeypatch.setattr(server, "_make_api_request", fake_request)
+
+    results = await asyncio.gather(*[server._cached_api_get("/labels", _ctx()) for _ in range(10)])
+
+    assert results == [["label"]] * 10
+    assert calls == 1
+    assert server._CACHE_LOCKS == {}
+
+
+async def test_read_in_flight_during_write_does_not_cache_old_list(monkeypatch):
+    monkeypatch.setattr(server, "_RESP_CACHE", {})
+    monkeypatch.setattr(server, "_CACHE_LOCKS", {})
+    monkeypatch.setattr(server, "_CACHE_GENERATIONS", {})
+    today = ["old"]
+
+    async def fake_request(endpoint, ctx, method="GET", data=None, params=None, full_access=False):
+        snapshot = list(today)
+        await asyncio.sleep(0.02)
+        return snapshot
+
+    monkeypatch.setattr(server, "_make_api_request", fake_request)
+
+    slow_read = asyncio.create_task(server._cached_api_get("/todayItems", _ctx()))
+    await asyncio.sleep(0)
+    today.append("new")
+    server._invalidate_cache(_ctx(), *server.TASK_LIST_ENDPOINTS)
+
+    assert await slow_read == ["old"]
+    assert await server._cached_api_get("/todayItems", _ctx()) == ["old", "new"]
+
+
+async def test_bulk_add_caps_requests_in_flight(monkeypatch):
+    in_flight = peak = 0
+
+    async def fake_request(endpoint, ctx, method="GET", data=None, params=None, full_access=False):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"_id": f"id-{data['title']}", "title": data["title"]}
+
+    monkeypatch.setattr(server, "_make_api_request", fake_request)
+    tools = {t.name: t.fn for t in server.create_server()._tool_manager.list_tools()}
+    params = server.AddTasksBulkInput(
+        tasks=[server.AddTaskInput(title=f"Task {i}") for i in range(server.MAX_BULK_TASKS)]
+    )
+
+    result = await tools["marvin_add_tasks_bulk"](params, _ctx())
+
+    assert f"Created {server.MAX_BULK_TASKS} of {server.MAX_BULK_TASKS} tasks" in result
+    assert peak == server.BULK_CONCURRENCY
+
+
+def _mock_client(monkeypatch, statuses):
+    """Serve responses with the given status codes in order; returns the request log."""
+    requests = []
+
+    def handler(request):
+        requests.append(request.method)
+        return httpx.Response(statuses[len(requests) - 1], json=["ok"])
+
+    client = httpx.AsyncClient(base_url=server.API_BASE_URL, transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(server, "_CLIENT", client)
+    monkeypatch.setattr(server, "RETRY_BASE_DELAY", 0)
+    return requests
+
+
+async def test_get_retries_transient_errors(monkeypatch):
+    requests = _mock_client(monkeypatch, [503, 503, 200])
+
+    assert await server._make_api_request("/labels", _ctx()) == ["ok"]
+    assert requests == ["GET"] * 3
+
+
+async def test_post_is_never_retried(monkeypatch):
+    requests = _mock_client(monkeypatch, [503, 200])
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await server._make_api_request("/addTask", _ctx(), method="POST", data={"title": "x"})
+    assert requests == ["POST"]
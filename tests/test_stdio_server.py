@@ -0,0 +1,67 @@
+"""Offline tests for the STDIO server (amazing_marvin_server.py)."""
+
+import json
+from datetime import datetime
+
+import amazing_marvin_server as server
+
+
+def _local_midnight_ms(day: str) -> int:
+    """Millisecond timestamp of local midnight on a YYYY-MM-DD date."""
+    return int(datetime.strptime(day, "%Y-%m-%d").timestamp() * 1000)
+
+
+def _due_tasks_by(monkeypatch, due_days):
+    """Stub /dueItems with one task per due date."""
+    tasks = [
+        {"_id": day, "title": f"Due {day}", "dueDate": _local_midnight_ms(day)}
+        for day in due_days
+    ]
+
+    async def fake_request(endpoint, method="GET", data=None, params=None, full_access=False):
+        return tasks
+
+    monkeypatch.setattr(server, "_make_api_request", fake_request)
+
+
+async def test_due_tasks_count_days_across_dst_change(monkeypatch, new_york_tz):
+    _due_tasks_by(monkeypatch, ["2024-03-05", "2024-03-10", "2024-03-11"])
+
+    result = json.loads(await server.marvin_get_due_tasks(
+        server.GetTasksInput(date="2024-03-11", response_format="json")
+    ))
+    overdue = {task["id"]: task.get("daysOverdue") for task in result["tasks"]}
+    assert overdue == {"2024-03-05": 6, "2024-03-10": 1, "2024-03-11": None}
+
+    markdown = await server.marvin_get_due_tasks(
+        server.GetTasksInput(date="2024-03-11", response_format="markdown")
+    )
+    assert "Due 2024-03-10 [OVERDUE]" in markdown
+    assert "Due 2024-03-11 [DUE TODAY]" in markdown
+
+
+async def test_oversized_json_response_stays_valid(monkeypatch):
+    _due_tasks_by(monkeypatch, ["2024-03-01"] * 2000)
+
+    result = await server.marvin_get_due_tasks(
+        server.GetTasksInput(date="2024-03-11", response_format="json")
+    )
+
+    assert len(result) <= server.CHARACTER_LIMIT
+    response = json.loads(result)
+    assert response["total"] == 2000
+    assert response["truncated"] is True
+    assert 0 < len(response["tasks"]) < 2000
+
+
+async def test_read_cache_stays_bounded(monkeypatch):
+    monkeypatch.setattr(server, "_cache", {})
+
+    async def fake_send(endpoint, method="GET", data=None, params=None, full_access=False):
+        return [params]
+
+    monkeypatch.setattr(server, "_send_request", fake_send)
+
+    for day in range(server.CACHE_MAX_ENTRIES * 2):
+        await server._make_api_request("/todayItems", params={"date": str(day)})
+    assert len(server._cache) <= server.CACHE_MAX_ENTRIES